@@ -55,7 +55,9 @@ Author: Based on Gregor Mendel's pea experiments (1856-1863)
 # ============================================================================
 
 # --- Standard Library (Built-ins) ---
+import bisect
 import csv
+import heapq
 import json
 import logging
 import os
@@ -66,6 +68,7 @@ import time
 import datetime as dt
 import math
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, wait as futures_wait
 from pathlib import Path
 from typing import List, Set
 
@@ -74,6 +77,7 @@ from PIL import Image, ImageDraw, ImageTk
 import tkinter as tk
 from tkinter import (
     colorchooser,
+    font as tkfont,
     messagebox,
     simpledialog,
     Toplevel,
@@ -99,6 +103,7 @@ from mendel_temperature_tracker import TemperatureTracker
 from emasculation_dialog import EmasculationDialog
 from pollination_dialog import PollinationDialog
 from mendelian_law_wizard import MendelianLawWizard
+import savefile
 
 
 # ============================================================================
@@ -483,6 +488,65 @@ os.makedirs(EXPORT_DIR, exist_ok=True)
 SEEDS_CSV = os.path.join(ICONS_DIR, "seeds.csv")  # keep next to icons for convenience
 TRAITS_CSV = os.path.join(ROOT_DIR, "traits_export.csv")  # export of selected plant traits
 
+# Generation labels ("F0", "F1", ...), parsed on lineage paths
+_GEN_RE = re.compile(r"F(\d+)")
+
+# Attributes read by GardenApp.seed_archive_from_live() (incl. legacy aliases)
+_ARCHIVE_SNAP_KEYS = (
+    "id", "generation", "gen", "mother_id", "motherId", "father_id", "fatherId",
+    "traits", "ancestry", "paternal_ancestry", "genotype",
+    "source_pod_index", "pod_index",
+)
+
+# Season-model death messages: (event-type substrings, cause), checked in order
+_SEASON_DEATH_CAUSES = (
+    (("critical_stress", "chronic"), "died from prolonged stress"),
+    (("senescent",), "died of old age"),
+)
+
+# Real-time mode: wall-clock hours at which each day phase begins. Hours
+# before the first boundary (night) still count as "evening".
+_PHASE_HOURS = (6, 12, 15, 19)
+_PHASE_NAMES = ("evening", "morning", "noon", "afternoon", "evening")
+
+_MON_NAMES = (
+    'January', 'February', 'March', 'April', 'May', 'June', 'July',
+    'August', 'September', 'October', 'November', 'December',
+)
+
+# Real-time split of one simulated hour (see GardenApp._recalc_timers): the
+# old reference speed spent 1050 ms on 3 temperature sub-updates and 600 ms
+# waiting after the phase advance. Seconds-per-hour × these = milliseconds.
+_SUB_FRAC = 1050.0 / 1650.0 / 3.0 * 1000.0    # per substep
+_PHASE_FRAC = 600.0 / 1650.0 * 1000.0         # after phase advance
+
+# Help window legends: (swatch colour, label) rows
+_HELP_HEALTH_LEGEND = (
+    ("#0c0", "Healthy (81–100)"),
+    ("#6f6", "Okay (61–80)"),
+    ("#ff0", "Stressed (41–60)"),
+    ("#f90", "Critical (21–40)"),
+    ("#f33", "Dying (1–20)"),
+    ("#666", "Dead (0)"),
+)
+_HELP_SOIL_LEGEND = (
+    ("#FFD54F", "Dry (0–25)"),
+    ("#81D4FA", "Slightly moist (26–50)"),
+    ("#42A5F5", "Evenly moist (51–75)"),
+    ("#1565C0", "Soggy (76–90)"),
+    ("#003F8C", "Waterlogged (91–100)"),
+)
+
+
+def _g(o, k, d=None):
+    """Field k of a plant given as a dict record or an object (default d)."""
+    return o.get(k, d) if type(o) is dict else getattr(o, k, d)
+
+
+def _list_or_empty(v):
+    """Copy of v as a list; a single new [] when v is empty or None."""
+    return list(v) if v else []
+
 
 class GardenApp:
     SEASON_MODES = ["off", "overlay", "enforce"]
@@ -1140,6 +1204,21 @@ class GardenApp:
         except Exception:
             pass   # decorative — never crash the simulation
 
+    @staticmethod
+    def _daynight_display_L(L):
+        # ── Display curve: remap L through a smoothstep crop ──────────────────
+        # Crop the long gradual dome tails (pre-dawn gloom, post-sunrise ramp)
+        # so the visible transition is concentrated into the twilight window.
+        # lo=0.10 -> fully dark below this, hi=0.70 -> fully bright above this.
+        # Smoothstep blend between them avoids hard edges at the crop points.
+        _lo, _hi = 0.10, 0.70
+        if L <= _lo:
+            return 0.0
+        if L >= _hi:
+            return 1.0
+        _t = (L - _lo) / (_hi - _lo)
+        return _t * _t * (3.0 - 2.0 * _t)  # smoothstep
+
     def _apply_daynight_to_tiles(self):
         # ── Update season cache once per frame ──────────────────────────────
         # Tiles read _bg_current_season directly for speed. Recomputing it here
@@ -1171,11 +1250,8 @@ class GardenApp:
         if not hasattr(self, "_daynight_cache"):
             self._daynight_cache = {}  # (base_hex, bucket) -> tinted_hex
 
-        # ── Sim date ──
-        yr  = int(getattr(self.garden, "year", 1856))
-        mon = int(getattr(self.garden, "month", 4))
-        dom = int(getattr(self.garden, "day_of_month", 1))
-        d = dt.date(yr, mon, dom)
+        # ── Sim date (built once per simulated day by the garden) ──
+        d = self.garden.current_date
 
         # ── Smooth fractional-hour interpolation ──────────────────────────────────
         # clock_hour is an integer (0-23) that jumps each next_phase().
@@ -1225,20 +1301,7 @@ class GardenApp:
             self._daynight_visual_L += max_step if delta > 0 else -max_step
 
         L = self._daynight_visual_L
-
-        # ── Display curve: remap L through a smoothstep crop ──────────────────
-        # Crop the long gradual dome tails (pre-dawn gloom, post-sunrise ramp)
-        # so the visible transition is concentrated into the twilight window.
-        # lo=0.10 -> fully dark below this, hi=0.70 -> fully bright above this.
-        # Smoothstep blend between them avoids hard edges at the crop points.
-        _lo, _hi = 0.10, 0.70
-        if L <= _lo:
-            L_display = 0.0
-        elif L >= _hi:
-            L_display = 1.0
-        else:
-            _t = (L - _lo) / (_hi - _lo)
-            L_display = _t * _t * (3.0 - 2.0 * _t)  # smoothstep
+        L_display = self._daynight_display_L(L)
 
         # Quantise to 100 steps — plenty for a smooth visual, cheaper cache
         bucket = int(round(L_display * 100))
@@ -1391,8 +1454,25 @@ class GardenApp:
         self.garden = GardenEnvironment(size=GRID_SIZE)
         self.garden._app = self  # Give garden access to app for difficulty settings
         self.inventory = Inventory()
+        # str(plant id) -> (stored entry, fingerprint, refs); see archive_snapshot_many()
+        self._archive_fp = {}
         self._eager_seed_and_backfill()
         self._img_cache = {}  # cache for composited tile images
+        self._help_legend_imgs = {}  # Help legend swatch columns, see _legend_swatches()
+        # Real-time phase and the epoch second at which it next changes
+        self._phase_cache = {"until_ts": 0.0, "phase": "morning"}
+        # Last values written to the calendar headers (see _header_key())
+        self._last_header_key = None
+        self._last_phase_key = None
+        # Single worker for save/load disk I/O so the Tk loop never blocks on it
+        self._io_pool = ThreadPoolExecutor(max_workers=1)
+        # Encode buffer reused across saves (used when msgspec is installed),
+        # and the write that may still be reading it
+        self._save_buf = bytearray(1 << 20)
+        self._save_fut = None
+        # Set once the TemperatureTracker below is created successfully;
+        # menu callbacks and save/load test this instead of hasattr()
+        self._has_temp_tracker = False
         self.next_plant_id = 1
         # === Unique Plant ID System ===
         self.used_ids = set()
@@ -1408,7 +1488,7 @@ class GardenApp:
         except Exception:
             pass
         
-        self.harvest_inventory = []
+        # harvest_inventory is a property over the Inventory's seed list
         self.seed_counter = 0  # for H<timestamp><n> suffix
         self.available_seeds = 22  # starter F0 seeds
         # NEW: global Mendelian-law discovery flags
@@ -1538,6 +1618,7 @@ class GardenApp:
                 data_dir="data",
                 climate_csv="climate/mendel_yearly_monthly_6_14_22.csv"
             )
+            self._has_temp_tracker = True
             self._last_temp_check_hour = self.garden.clock_hour
 
             # 🔑 IMPORTANT: sync temp button state now that tracker exists
@@ -1546,6 +1627,7 @@ class GardenApp:
         except Exception as e:
             logging.error(f"Failed to initialize temperature tracker: {e}")
             self.temp_tracker = None
+            self._has_temp_tracker = False
 
         # app._season_cycle_mode = lambda e=None: (
         #     setattr(app, "_season_mode", {"off":"overlay","overlay":"enforce","enforce":"off"}[getattr(app, "_season_mode", "off")]) or
@@ -1562,12 +1644,24 @@ class GardenApp:
         friendly_name = mode_names.get(self._season_mode, self._season_mode)
         self._toast(f"Season model loaded (Difficulty: {friendly_name}). Press F9 to cycle or use Game Settings menu.")
         
-        # Periodic season polling to apply lethal/stress without day change
-        def _season_poll_loop():
-            self._season_poll()
-            self.root.after(1200, _season_poll_loop)
-        _season_poll_loop()
+        # Season updates are driven by date changes: _season_poll() runs after
+        # every garden.next_phase() (and after a load); this covers the start date
+        self._season_poll()
+
+    @property
+    def harvest_inventory(self):
+        """
+        Harvested seeds: the Inventory's seed category list itself.
+
+        Reading through the Inventory means both views stay the same list
+        even when either side replaces it (Inventory.remove(), or assigning
+        a filtered list here).
+        """
+        return self.inventory._items_seeds
 
+    @harvest_inventory.setter
+    def harvest_inventory(self, seeds):
+        self.inventory._items_seeds = seeds
     
     def _confirm_remove_all(self):
         """Ask once before clearing the entire grid."""
@@ -1900,10 +1994,10 @@ class GardenApp:
                     removed_count += 1
                     # Unregister from garden
                     try:
-                        if plant in self.garden.plants:
-                            self.garden.plants.remove(plant)
+                        self.garden.unregister_plant(plant)
                     except Exception:
                         pass
+                    self._archive_fp.pop(str(plant.id), None)
         
         # Force a re-render if we removed any plants
         if removed_count > 0:
@@ -1921,8 +2015,32 @@ class GardenApp:
                 except Exception:
                     pass
             self._auto_loop_id = self.root.after(delay_ms, self._auto_advance_phase)
+            self._auto_deadline = time.monotonic() + delay_ms / 1000.0
         except Exception:
             self._auto_loop_id = None
+
+    def _schedule_auto_tick(self, period_ms):
+        """
+        Schedule the next auto-advance one period after the previous deadline.
+
+        Measuring from the deadline instead of from the end of this tick's
+        work keeps render time from stretching every simulated hour. A loop
+        that has fallen a full period behind restarts from now rather than
+        firing a burst of catch-up ticks.
+        """
+        now = time.monotonic()
+        deadline = getattr(self, "_auto_deadline", None)
+        deadline = (now if deadline is None else deadline) + period_ms / 1000.0
+        delay_ms = int((deadline - now) * 1000)
+        if delay_ms >= 10:
+            self._ensure_auto_loop(delay_ms=delay_ms)
+            # Keep the exact float deadline so the ms truncation above
+            # doesn't accumulate from tick to tick
+            self._auto_deadline = deadline
+        else:
+            # Behind schedule: short floor (back-to-back timers would starve
+            # Tk's idle redraws) and the deadline restarts from now
+            self._ensure_auto_loop(delay_ms=10)
     def _auto_advance_phase(self):
         """Auto-advance phases with a single stable loop (no duplication)."""
         # If paused, just reschedule and return
@@ -1950,11 +2068,12 @@ class GardenApp:
                     self._frame_skip_counter = n + 1
                 except Exception:
                     pass
-                self._ensure_auto_loop(delay_ms=getattr(self, 'sub_ms', 350))
+                self._schedule_auto_tick(getattr(self, 'sub_ms', 350))
                 return
 
             # Advance phase and optionally render
             self.garden.next_phase()
+            self._season_poll()
             self._daynight_last_advance = time.time()  # smooth day/night interpolation
 
             # Clean up old dead plants (check every hour)
@@ -2025,7 +2144,7 @@ class GardenApp:
                 self._frame_skip_counter = n + 1
             except Exception:
                 pass
-            self._ensure_auto_loop(delay_ms=getattr(self, 'phase_ms', 600))
+            self._schedule_auto_tick(getattr(self, 'phase_ms', 600))
 
         except Exception:
             self._ensure_auto_loop(delay_ms=getattr(self, 'phase_ms', 600))
@@ -2599,7 +2718,7 @@ class GardenApp:
         
         # Meteorological Observatory
         def _open_observatory():
-            if hasattr(self, 'temp_tracker') and self.temp_tracker:
+            if self._has_temp_tracker:
                 self.temp_tracker.open_observatory()
             else:
                 messagebox.showinfo("Observatory", "Temperature tracker not available")
@@ -3080,7 +3199,7 @@ class GardenApp:
                 image=observatory_icon,
                 compound="left",
                 command=lambda: (
-                    self.temp_tracker.open_observatory() if hasattr(self, 'temp_tracker') and self.temp_tracker
+                    self.temp_tracker.open_observatory() if self._has_temp_tracker
                     else messagebox.showinfo("Observatory", "Temperature tracker not available")
                 ),
                 **btn_kwargs,
@@ -3092,7 +3211,7 @@ class GardenApp:
                 inventory_left,
                 text="🔭 Observatory",
                 command=lambda: (
-                    self.temp_tracker.open_observatory() if hasattr(self, 'temp_tracker') and self.temp_tracker
+                    self.temp_tracker.open_observatory() if self._has_temp_tracker
                     else messagebox.showinfo("Observatory", "Temperature tracker not available")
                 ),
                 **btn_kwargs,
@@ -3331,27 +3450,40 @@ class GardenApp:
 
 
 
-    def _update_header(self):
-        def _mon_name(m):
-            names = ['January','February','March','April','May','June','July','August','September','October','November','December']
-            try:
-                return names[int(m)-1]
-            except Exception:
-                return str(m)
-        def _fmt_clock(h, mi):
-            try:
-                return f"{int(h):02d}:{int(mi):02d}"
-            except Exception:
-                return '06:00'
+    def _header_key(self):
+        """Values shown in the calendar headers, as a tuple for change checks."""
+        g = self.garden
+        temp = getattr(g, 'temp', None)
+        return (
+            getattr(g, 'day_of_month', getattr(g, 'day', 1)),
+            getattr(g, 'month', 4),
+            getattr(g, 'year', 1856),
+            int(getattr(g, 'clock_hour', 8)),
+            int(getattr(g, 'clock_minute', 0)),
+            getattr(g, 'weather', ''),
+            None if temp is None else round(temp, 1),
+        )
+
+    @staticmethod
+    def _mon_name(m):
         try:
-            mon = _mon_name(getattr(self.garden, 'month', 4))
-            yr = getattr(self.garden, 'year', 1856)
-            dom = getattr(self.garden, 'day_of_month', getattr(self.garden, 'day', 1))
-            wx = getattr(self.garden, 'weather', '')
-            hh = getattr(self.garden, 'clock_hour', 8)
-            mm = getattr(self.garden, 'clock_minute', 0)
-            tmp = f"{getattr(self.garden, 'temp', 0.0):.1f}°C" if hasattr(self.garden, 'temp') else ''
-            self.header_label.configure(text=f"📅 {mon} {yr} — Day {dom} — { _fmt_clock(hh,mm) } — {wx}  {tmp}")
+            return _MON_NAMES[int(m) - 1] if 1 <= int(m) <= 12 else str(m)
+        except Exception:
+            return str(m)
+
+    def _update_header(self):
+        label = getattr(self, 'header_label', None)
+        if label is None:
+            return  # layout without a separate header; see _update_phase_label()
+        try:
+            key = self._header_key()
+            if key == self._last_header_key:
+                return  # unchanged: skip formatting and the Tk redraw
+            dom, month, yr, hh, mm, wx, temp = key
+            tmp = f"{temp:.1f}°C" if temp is not None else ''
+            label.configure(
+                text=f"📅 {self._mon_name(month)} {yr} — Day {dom} — {hh:02d}:{mm:02d} — {wx}  {tmp}")
+            self._last_header_key = key
         except Exception:
             pass
 
@@ -3360,6 +3492,14 @@ class GardenApp:
 # Rendering Methods
 # ============================================================================
     def render_all(self):
+        self.render_tiles(range(len(self.tiles)))
+
+    def render_tiles(self, indices):
+        """Like render_all(), but only redraws the tiles at the given indices.
+
+        Header, labels and day/night shading are refreshed as usual; use this
+        when only a known subset of tiles can have changed.
+        """
         try:
             self._update_header()
         except Exception:
@@ -3398,7 +3538,9 @@ class GardenApp:
         selected_idx = getattr(self, "selected_index", None)
         sel_set = getattr(self, "multi_selected_indices", None) or set()
 
-        for i, tile in enumerate(self.tiles):
+        tiles = self.tiles
+        for i in indices:
+            tile = tiles[i]
             is_sel = (selected_idx == i) or (i in sel_set)
             tile.selected = is_sel
 
@@ -3409,17 +3551,19 @@ class GardenApp:
             tile.render()
 
         # Update centered header (Day / Phase / Weather)
+        self._update_phase_label()
+        self._render_selection_panel()
+
+    def _update_phase_label(self):
         try:
-            mon_names = ['January','February','March','April','May','June','July','August','September','October','November','December']
-            mon = mon_names[getattr(self.garden, 'month', 4)-1] if 1 <= getattr(self.garden, 'month', 4) <= 12 else str(getattr(self.garden, 'month', 4))
-            dom = getattr(self.garden, 'day_of_month', getattr(self.garden, 'day', 1))
-            yr  = getattr(self.garden, 'year', 1856)
-            hh  = getattr(self.garden, 'clock_hour', 8)
-            mm  = getattr(self.garden, 'clock_minute', 0)
-            wx  = getattr(self.garden, 'weather', '')
-            tmp = f"{getattr(self.garden, 'temp', 0.0):.1f}°C" if hasattr(self.garden, 'temp') else ''
-            clock = f"{int(hh):02d}:{int(mm):02d}"
-            self.phase_label.configure(text=f"{dom} {mon} {yr} — {clock} — {wx} {tmp}")
+            key = self._header_key()
+            if key == self._last_phase_key:
+                return  # unchanged: skip formatting and the Tk redraw
+            dom, month, yr, hh, mm, wx, temp = key
+            tmp = f"{temp:.1f}°C" if temp is not None else ''
+            self.phase_label.configure(
+                text=f"{dom} {self._mon_name(month)} {yr} — {hh:02d}:{mm:02d} — {wx} {tmp}")
+            self._last_phase_key = key
             try:
                 # Season overlay info suppressed from status bar to avoid permanent message
                 # (kept available via self._season_mode for other UI components if needed)
@@ -3429,8 +3573,32 @@ class GardenApp:
                 pass
         except Exception:
             pass
-        self._render_selection_panel()
-        
+
+    def _ff_render(self):
+        """Redraw during fast-forward, skipping the full pass when nothing changed.
+
+        A full render_all() is only needed when the garden reports a visible
+        plant/weather/calendar change or the day/night shading level moved;
+        otherwise just the clock text in the headers is refreshed.
+        """
+        bucket = -1  # shading is static while day/night is disabled
+        if getattr(self, "enable_daynight", True):
+            try:
+                L = self._compute_light_factor(self.garden.current_date,
+                                               float(self.garden.clock_hour))
+                bucket = int(round(self._daynight_display_L(L) * 100))
+            except Exception:
+                bucket = None
+
+        if (getattr(self.garden, "_dirty", True)
+                or bucket is None or bucket != getattr(self, "_ff_last_bucket", None)):
+            self.render_all()
+            self.garden._dirty = False
+            self._ff_last_bucket = bucket
+        else:
+            self._update_header()
+            self._update_phase_label()
+
     def _label_with_bold_gender(self, parent, text, base_font=("Segoe UI", 12), bold_font=("Segoe UI", 12, "bold")):
         """Create inline labels where ♀ and ♂ are bold for visibility."""
         container = tk.Frame(parent)
@@ -5032,6 +5200,7 @@ class GardenApp:
     def _on_next_phase(self):
         old_hour = int(getattr(self.garden, 'clock_hour', 8))
         self.garden.next_phase()
+        self._season_poll()
         self._daynight_last_advance = time.time()  # smooth day/night interpolation
         new_hour = int(getattr(self.garden, 'clock_hour', 8))
         
@@ -6392,26 +6561,19 @@ class GardenApp:
 
         total_hours = days * 24  # simulate N full days
         last_day_key = None
+        self._ff_last_bucket = None  # first FF frame is always a full render
 
         for step in range(total_hours):
             # ---------------- New day detection & daily setup ----------------
             try:
-                day_key = (
-                    self.garden.year,
-                    self.garden.month,
-                    self.garden.day_of_month,
-                )
+                day_key = self.garden.current_date
             except Exception:
                 day_key = None
 
             if day_key != last_day_key:
                 # Daily climate & weather
                 try:
-                    sim_date = dt.date(
-                        self.garden.year,
-                        self.garden.month,
-                        self.garden.day_of_month,
-                    )
+                    sim_date = day_key
                     st = self._climate_v2.daily_state(sim_date)
                     self.garden.target_temps = {
                         "hours": st["hours"],
@@ -6455,6 +6617,7 @@ class GardenApp:
                 self.garden.next_phase()
             except Exception:
                 pass
+            self._season_poll()
 
             # Snow accumulation / melt — same logic as normal mode.
             # Runs every sim-hour so FF snow state is correct.
@@ -6477,7 +6640,7 @@ class GardenApp:
                 if getattr(self, "ff_render_daily", None) is not None and self.ff_render_daily.get():
                     # Daily mode: render once per simulated day
                     if (step + 1) % 24 == 0:
-                        self.render_all()
+                        self._ff_render()
                         try:
                             self.root.update_idletasks()
                             self.root.update()
@@ -6496,7 +6659,7 @@ class GardenApp:
 
                     self._ff_ui_counter = getattr(self, "_ff_ui_counter", 0) + 1
                     if (self._ff_ui_counter % interval) == 0:
-                        self.render_all()
+                        self._ff_render()
                         try:
                             self.root.update_idletasks()
                             self.root.update()
@@ -6614,20 +6777,61 @@ class GardenApp:
             if is_named:
                 save_data['garden_name'] = garden_name.strip()
             
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(save_data, f, indent=2, ensure_ascii=False)
-            
-            # Clean up old unnamed saves (keep only 10 most recent)
-            if not is_named:
-                self._cleanup_unnamed_saves(data_dir)
-            
-            display_name = garden_name.strip() if is_named else f"Unnamed ({timestamp})"
-            self._toast(f"Garden saved: {display_name}", level="info")
-            logging.info(f"Garden saved to {filepath}")
+            # Compression is opt-in and gets its own format version, so
+            # builds without zstandard reject the save instead of misreading it
+            compressed = savefile.compression_enabled()
+            if compressed:
+                save_data['version'] = savefile.SAVE_VERSION_ZSTD
             
+            # Encode here: save_data still references live plant/archive
+            # objects, so only the finished bytes may leave the Tk thread.
+            # The previous write must finish before its buffer is reused.
+            if self._save_fut is not None:
+                futures_wait([self._save_fut])
+            payload = savefile.dumps(save_data, self._save_buf)
         except Exception as e:
             logging.error(f"Failed to save garden: {e}", exc_info=True)
             messagebox.showerror("Save Failed", f"Could not save garden:\n{str(e)}")
+            return
+        
+        display_name = garden_name.strip() if is_named else f"Unnamed ({timestamp})"
+        
+        def _on_saved(fut):
+            try:
+                fut.result()
+            except Exception as e:
+                logging.error(f"Failed to save garden: {e}", exc_info=True)
+                messagebox.showerror("Save Failed", f"Could not save garden:\n{str(e)}")
+                return
+            self._toast(f"Garden saved: {display_name}", level="info")
+            logging.info(f"Garden saved to {filepath}")
+        
+        fut = self._io_pool.submit(
+            self._write_save_file, filepath, payload,
+            None if is_named else data_dir, compressed,
+        )
+        self._save_fut = fut
+        self._after_io(fut, _on_saved)
+    
+    def _write_save_file(self, filepath, payload, cleanup_dir=None, compressed=False):
+        """Write an encoded save to disk (runs on the I/O worker thread)."""
+        with open(filepath, 'wb') as f:
+            f.write(savefile.compress(payload) if compressed else payload)
+        
+        # Clean up old unnamed saves (keep only 10 most recent)
+        if cleanup_dir:
+            self._cleanup_unnamed_saves(cleanup_dir)
+    
+    def _read_save_file(self, filepath):
+        """Read and decode a save file (runs on the I/O worker thread)."""
+        return savefile.load(filepath)
+    
+    def _after_io(self, fut, callback, poll_ms=20):
+        """Call callback(fut) on the Tk thread once an I/O future completes."""
+        if fut.done():
+            callback(fut)
+        else:
+            self.root.after(poll_ms, self._after_io, fut, callback, poll_ms)
     
     def _show_save_name_dialog(self):
         """Show a simple dialog to enter garden name."""
@@ -6666,32 +6870,31 @@ class GardenApp:
                     
                     # Try to read the garden name from the file
                     try:
-                        with open(filepath, 'r', encoding='utf-8') as f:
-                            save_data = json.load(f)
-                            stored_name = save_data.get('garden_name')
+                        save_data = savefile.load(filepath)
+                        stored_name = save_data.get('garden_name')
+                        
+                        # Check if names match (case-insensitive comparison)
+                        if stored_name and stored_name.strip().lower() == garden_name.strip().lower():
+                            # Extract timestamp from filename for display
+                            name_part = filename.replace("garden_", "").replace(".json", "")
+                            timestamp_str = name_part[-15:] if len(name_part) >= 15 else ""
                             
-                            # Check if names match (case-insensitive comparison)
-                            if stored_name and stored_name.strip().lower() == garden_name.strip().lower():
-                                # Extract timestamp from filename for display
-                                name_part = filename.replace("garden_", "").replace(".json", "")
-                                timestamp_str = name_part[-15:] if len(name_part) >= 15 else ""
-                                
-                                try:
-                                    if len(timestamp_str) == 15:
-                                        date_part = timestamp_str[:8]
-                                        time_part = timestamp_str[9:]
-                                        display_date = f"{date_part[:4]}-{date_part[4:6]}-{date_part[6:8]} {time_part[:2]}:{time_part[2:4]}:{time_part[4:6]}"
-                                    else:
-                                        display_date = "Unknown date"
-                                except:
+                            try:
+                                if len(timestamp_str) == 15:
+                                    date_part = timestamp_str[:8]
+                                    time_part = timestamp_str[9:]
+                                    display_date = f"{date_part[:4]}-{date_part[4:6]}-{date_part[6:8]} {time_part[:2]}:{time_part[2:4]}:{time_part[4:6]}"
+                                else:
                                     display_date = "Unknown date"
-                                
-                                return {
-                                    'filename': filename,
-                                    'filepath': filepath,
-                                    'garden_name': stored_name,
-                                    'display_date': display_date
-                                }
+                            except:
+                                display_date = "Unknown date"
+                            
+                            return {
+                                'filename': filename,
+                                'filepath': filepath,
+                                'garden_name': stored_name,
+                                'display_date': display_date
+                            }
                     except:
                         # Skip files that can't be read
                         continue
@@ -6701,37 +6904,38 @@ class GardenApp:
             logging.warning(f"Error searching for existing save: {e}")
             return None
     
-    def _cleanup_unnamed_saves(self, data_dir):
+    def _cleanup_unnamed_saves(self, data_dir, keep=10):
         """Keep only the 10 most recent unnamed saves, delete older ones."""
         try:
             # Find all unnamed save files (those without a name between garden_ and timestamp)
             unnamed_saves = []
             
-            for filename in os.listdir(data_dir):
-                if filename.startswith("garden_") and filename.endswith(".json"):
-                    # Check if it's an unnamed save (garden_TIMESTAMP.json pattern)
-                    # Unnamed: garden_20260131_123456.json (20 chars before .json)
-                    # Named: garden_NAME_20260131_123456.json (more than 20 chars)
-                    name_part = filename.replace("garden_", "").replace(".json", "")
-                    
-                    # If name_part is exactly YYYYMMDD_HHMMSS (15 chars), it's unnamed
-                    if len(name_part) == 15 and name_part[8] == '_':
-                        filepath = os.path.join(data_dir, filename)
-                        mtime = os.path.getmtime(filepath)
-                        unnamed_saves.append((filename, filepath, mtime))
-            
-            # Sort by modification time (oldest first for deletion)
-            unnamed_saves.sort(key=lambda x: x[2])
+            with os.scandir(data_dir) as it:
+                for entry in it:
+                    filename = entry.name
+                    if filename.startswith("garden_") and filename.endswith(".json"):
+                        # Check if it's an unnamed save (garden_TIMESTAMP.json pattern)
+                        # Unnamed: garden_20260131_123456.json (20 chars before .json)
+                        # Named: garden_NAME_20260131_123456.json (more than 20 chars)
+                        name_part = filename.replace("garden_", "").replace(".json", "")
+                        
+                        # If name_part is exactly YYYYMMDD_HHMMSS (15 chars), it's unnamed
+                        if len(name_part) == 15 and name_part[8] == '_':
+                            unnamed_saves.append(entry)
             
-            # Keep only the 10 most recent (delete the rest)
-            if len(unnamed_saves) > 10:
-                to_delete = unnamed_saves[:-10]  # All except the last 10
-                for filename, filepath, mtime in to_delete:
-                    try:
-                        os.remove(filepath)
-                        logging.info(f"Deleted old unnamed save: {filename}")
-                    except Exception as e:
-                        logging.warning(f"Failed to delete old save {filename}: {e}")
+            # Only the oldest (n - keep) are needed, so skip the full sort
+            excess = len(unnamed_saves) - keep
+            if excess <= 0:
+                return
+            to_delete = heapq.nsmallest(
+                excess, unnamed_saves, key=lambda e: e.stat().st_mtime
+            )
+            for entry in to_delete:
+                try:
+                    os.remove(entry.path)
+                    logging.info(f"Deleted old unnamed save: {entry.name}")
+                except Exception as e:
+                    logging.warning(f"Failed to delete old save {entry.name}: {e}")
         
         except Exception as e:
             logging.warning(f"Failed to cleanup unnamed saves: {e}")
@@ -6753,9 +6957,8 @@ class GardenApp:
                 
                 # Try to read garden name
                 try:
-                    with open(filepath, 'r', encoding='utf-8') as f:
-                        save_data = json.load(f)
-                        garden_name = save_data.get('garden_name')
+                    save_data = savefile.load(filepath)
+                    garden_name = save_data.get('garden_name')
                 except:
                     garden_name = None
                 
@@ -6974,9 +7177,8 @@ class GardenApp:
                     
                     # Try to read the save file to get the stored name
                     try:
-                        with open(filepath, 'r', encoding='utf-8') as f:
-                            save_data = json.load(f)
-                            stored_name = save_data.get('garden_name')
+                        save_data = savefile.load(filepath)
+                        stored_name = save_data.get('garden_name')
                     except:
                         stored_name = None
                     
@@ -7051,9 +7253,15 @@ class GardenApp:
     
     def _load_garden_from_file(self, filepath):
         """Load garden state from a specific file."""
+        self._after_io(
+            self._io_pool.submit(self._read_save_file, filepath),
+            lambda fut: self._on_save_file_read(fut, filepath),
+        )
+    
+    def _on_save_file_read(self, fut, filepath):
+        """Finish loading once the save file has been read off-thread."""
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                save_data = json.load(f)
+            save_data = fut.result()
             
             # Confirm before loading (this will replace current garden)
             filename = os.path.basename(filepath)
@@ -7077,84 +7285,37 @@ class GardenApp:
     
     def _serialize_garden_state(self):
         """Serialize the entire garden state to a dictionary."""
-        import datetime
-        
         # Serialize all plants
-        plants_data = []
+        plant_fields, plant_values = savefile.PLANT_FIELDS, savefile.plant_values
+        plant_extras = savefile.PLANT_EXTRAS
+        # At most one plant per tile: size the list up front, fill by index
+        # and trim once, instead of growing it append by append.
+        plants_data = [None] * len(self.tiles)
+        n = 0
+        # Distinct trait dicts, referenced from plant records by index
+        traits_pool, traits_index = [], {}
         for tile in self.tiles:
-            if tile.plant and tile.plant.alive:
-                plant_data = {
-                    'tile_idx': tile.idx,
-                    'id': tile.plant.id,
-                    'generation': tile.plant.generation,
-                    'stage': tile.plant.stage,
-                    'alive': tile.plant.alive,
-                    'days_since_planting': tile.plant.days_since_planting,
-                    'health': tile.plant.health,
-                    'water': tile.plant.water,
-                    'traits': tile.plant.traits,
-                    'revealed_traits': tile.plant.revealed_traits,
-                    'reveal_order': tile.plant.reveal_order,
-                    'entered_stage5_age': tile.plant.entered_stage5_age,
-                    'max_age_days': tile.plant.max_age_days,
-                    'senescent': tile.plant.senescent,
-                    'germination_delay': tile.plant.germination_delay,
-                    'pending_cross': tile.plant.pending_cross,
-                    'pollinated': tile.plant.pollinated,
-                    'emasculated': tile.plant.emasculated,
-                    'emasc_day': tile.plant.emasc_day,
-                    'emasc_phase': tile.plant.emasc_phase,
-                    'selfing_frac_before_emasc': tile.plant.selfing_frac_before_emasc,
-                    'pods_total': tile.plant.pods_total,
-                    'pods_remaining': tile.plant.pods_remaining,
-                    'ovules_per_pod': tile.plant.ovules_per_pod,
-                    'ovules_left': tile.plant.ovules_left,
-                    'aborted_ovules': tile.plant.aborted_ovules,
-                    'fully_harvested': getattr(tile.plant, 'fully_harvested', False),
-                    'ancestry': tile.plant.ancestry,
-                    'paternal_ancestry': tile.plant.paternal_ancestry,
-                    'genotype': getattr(tile.plant, 'genotype', None),
-                    'last_anther_check_day': tile.plant.last_anther_check_day,
-                    'anthers_available_today': tile.plant.anthers_available_today,
-                    'anthers_collected_day': tile.plant.anthers_collected_day,
-                    # Parentage — dynamic attrs set by plant_seed(), not in the dataclass
-                    'mother_id': getattr(tile.plant, 'mother_id', None),
-                    'father_id': getattr(tile.plant, 'father_id', None),
-                    'selfed':    getattr(tile.plant, 'selfed', False),
-                    # Pod provenance — needed by TIE to group siblings by pod
-                    'source_pod_index': getattr(tile.plant, 'source_pod_index', None),
-                    'is_weak': getattr(tile.plant, 'is_weak', False),
-                    'weak_blocks_flowering': getattr(tile.plant, 'weak_blocks_flowering', False),
-                    'late_season_stress': getattr(tile.plant, 'late_season_stress', False),
-                }
-                plants_data.append(plant_data)
+            plant = tile.plant
+            if plant and plant.alive:
+                plant_data = dict(zip(plant_fields, plant_values(plant)))
+                plant_data['tile_idx'] = tile.idx
+                for key, default in plant_extras:
+                    plant_data[key] = getattr(plant, key, default)
+                savefile.pool_traits(plant_data, traits_pool, traits_index)
+                plants_data[n] = plant_data
+                n += 1
+        del plants_data[n:]
         
         # Serialize inventory
+        seed_fields, seed_values = savefile.SEED_FIELDS, savefile.seed_values
+        pollen_fields, pollen_values = savefile.POLLEN_FIELDS, savefile.pollen_values
         inventory_data = {
             'seeds': [
-                {
-                    'name': seed.name,
-                    'id': seed.id,
-                    'source_id': seed.source_id,
-                    'donor_id': seed.donor_id,
-                    'traits': seed.traits,
-                    'generation': seed.generation,
-                    'pod_index': seed.pod_index,
-                    'genotype': seed.genotype,
-                    'ancestry': seed.ancestry,
-                }
+                dict(zip(seed_fields, seed_values(seed)))
                 for seed in self.harvest_inventory
             ],
             'pollen': [
-                {
-                    'name': pollen.name,
-                    'id': pollen.id,
-                    'source_id': pollen.source_id,
-                    'collected_day': pollen.collected_day,
-                    'expires_day': pollen.expires_day,
-                    'genotype': pollen.genotype,
-                    'traits': pollen.traits,
-                }
+                dict(zip(pollen_fields, pollen_values(pollen)))
                 for pollen in self.inventory.get_all('pollen')
             ]
         }
@@ -7174,15 +7335,17 @@ class GardenApp:
             'temp_updates_remaining': getattr(self.garden, 'temp_updates_remaining', 3),
         }
         
-        # Serialize history (stored on GardenApp or GardenEnvironment)
-        history_data = list(getattr(self.garden, 'history', []))
+        # Serialize history (stored on GardenApp or GardenEnvironment).
+        # No copy needed: the save is encoded before control returns to Tk,
+        # so the list cannot change underneath the encoder.
+        history_data = getattr(self.garden, 'history', None) or []
         
         # Serialize next_plant_id (stored on GardenApp)
         next_plant_id = getattr(self, 'next_plant_id', 1)
         
         # Serialize temperature tracker
         temp_tracker_data = None
-        if hasattr(self, 'temp_tracker') and self.temp_tracker:
+        if self._has_temp_tracker:
             temp_tracker_data = {
                 'measurements': self.temp_tracker.measurements,
                 'modern_measurements': getattr(self.temp_tracker, 'modern_measurements', []),
@@ -7203,18 +7366,22 @@ class GardenApp:
         }
         
         # Serialize archive (for Trait Inheritance Explorer)
+        # (archive/lineage_store can be replaced by the explorer windows, so
+        # they are read once each rather than tracked with a flag)
         archive_data = None
-        if hasattr(self, 'archive') and isinstance(self.archive, dict):
+        archive = getattr(self, 'archive', None)
+        if isinstance(archive, dict):
             # Normalize to string keys to prevent int/str key collisions in JSON
             archive_data = {
-                'plants': {str(k): v for k, v in self.archive.get('plants', {}).items()}
+                'plants': {str(k): v for k, v in archive.get('plants', {}).items()}
             }
 
         # Serialize lineage_store (TIE reads from both archive and lineage_store)
         lineage_store_data = None
-        if hasattr(self, 'lineage_store') and isinstance(self.lineage_store, dict):
+        lineage_store = getattr(self, 'lineage_store', None)
+        if isinstance(lineage_store, dict):
             lineage_store_data = {
-                'plants': {str(k): v for k, v in self.lineage_store.get('plants', {}).items()}
+                'plants': {str(k): v for k, v in lineage_store.get('plants', {}).items()}
             }
 
         # Serialize Mendelian law progress flags
@@ -7231,9 +7398,12 @@ class GardenApp:
         }
 
         # Compile everything
+        save_ns = savefile.timestamp_ns()
         save_data = {
-            'version': 'v1.0',
-            'save_date': datetime.datetime.now().isoformat(),
+            'version': savefile.SAVE_VERSION,
+            'save_date_ns': save_ns,
+            'save_date': savefile.format_timestamp(save_ns),
+            'traits_pool': traits_pool,
             'plants': plants_data,
             'inventory': inventory_data,
             'garden': garden_data,
@@ -7254,8 +7424,11 @@ class GardenApp:
         # Clear current garden — must unregister from garden.plants too,
         # otherwise stale plant objects linger in the set and _seed_archive_safe()
         # would later overwrite the freshly-loaded archive with old-session data.
+        # Tiles that lose or gain a plant are the only ones that need redrawing.
+        dirty_tiles = set()
         for tile in self.tiles:
             if tile.plant is not None:
+                dirty_tiles.add(tile.idx)
                 try:
                     self.garden.unregister_plant(tile.plant)
                 except Exception:
@@ -7263,7 +7436,7 @@ class GardenApp:
             tile.plant = None
         # Belt-and-suspenders: clear any orphaned entries that bypass tile tracking
         try:
-            self.garden.plants.clear()
+            self.garden.clear_plants()
         except Exception:
             pass
         
@@ -7271,12 +7444,13 @@ class GardenApp:
         garden_data = save_data['garden']
         self.garden.day = garden_data.get('day', 1)
         self.garden.phase_index = garden_data.get('phase_index', 0)
-        self.garden.phase = garden_data.get('phase', 'morning')
+        self.garden.phase = savefile.intern_str(garden_data.get('phase', 'morning'))
         self.garden.clock_hour = garden_data.get('clock_hour', 8)
         self.garden.year = garden_data.get('year', 1856)
         self.garden.month = garden_data.get('month', 4)
         self.garden.day_of_month = garden_data.get('day_of_month', 1)
-        self.garden.weather = garden_data.get('weather', '☀️')
+        self.garden._current_date = None
+        self.garden.weather = savefile.intern_str(garden_data.get('weather', '☀️'))
         self.garden.temp = garden_data.get('temp', 12.0)
         
         # Restore optional attributes
@@ -7286,8 +7460,6 @@ class GardenApp:
             self.garden.temp_updates_remaining = garden_data['temp_updates_remaining']
         
         # Restore history
-        if not hasattr(self.garden, 'history'):
-            self.garden.history = []
         self.garden.history = save_data.get('history', [])
         
         # Restore archive (for Trait Inheritance Explorer)
@@ -7298,6 +7470,8 @@ class GardenApp:
             self.archive['plants'] = archive_data.get('plants', {})
         else:
             self.archive['plants'] = {}
+        # Fingerprints describe the previous game's archive entries
+        self._archive_fp.clear()
 
         # Restore lineage_store and merge with archive so TIE has the full picture
         if not hasattr(self, 'lineage_store'):
@@ -7346,7 +7520,7 @@ class GardenApp:
         self.next_plant_id = save_data.get('next_plant_id', 1)
         
         # Restore temperature tracker
-        if save_data.get('temperature_tracker') and hasattr(self, 'temp_tracker') and self.temp_tracker:
+        if self._has_temp_tracker and save_data.get('temperature_tracker'):
             temp_data = save_data['temperature_tracker']
             self.temp_tracker.measurements = temp_data.get('measurements', [])
             self.temp_tracker.modern_measurements = temp_data.get('modern_measurements', [])
@@ -7375,125 +7549,87 @@ class GardenApp:
         # Restore inventory
         inventory_data = save_data['inventory']
         
-        # Clear both inventory systems
-        self.inventory._items_seeds.clear()
-        self.harvest_inventory.clear()
+        # Clear the harvest list (the Inventory's seed category)
+        self.harvest_inventory = []
+        
+        # Per-item messages only when DEBUG is on: building the f-strings
+        # alone dominated restore time for large inventories
+        log_items = logging.getLogger().isEnabledFor(logging.DEBUG)
         
         seeds_to_restore = inventory_data.get('seeds', [])
-        logging.info(f"Restoring {len(seeds_to_restore)} seeds from save file")
+        seed_failures = 0
         
+        seed_state, add_seed = savefile.seed_state, self.harvest_inventory.append
         for seed_data in seeds_to_restore:
             try:
                 # Seed inherits from InventoryItem(name, id)
                 # Then has: source_id, donor_id, traits, generation, pod_index, genotype, ancestry
-                seed = Seed(
-                    name=seed_data.get('name', f"Seed_{seed_data['id']}"),
-                    id=seed_data['id'],
-                    source_id=seed_data['source_id'],
-                    donor_id=seed_data.get('donor_id'),
-                    traits=seed_data.get('traits', {}),
-                    generation=seed_data.get('generation', 0),
-                    pod_index=seed_data.get('pod_index', 0),
-                    genotype=seed_data.get('genotype', {}),
-                    ancestry=seed_data.get('ancestry', []),
-                )
-                # Add to both inventory systems for compatibility
-                self.inventory._items_seeds.append(seed)
-                self.harvest_inventory.append(seed)
-                logging.info(f"Restored seed: {seed.name} (ID: {seed.id})")
+                # Missing fields are filled from savefile's schema tables
+                seed = Seed(**seed_state(seed_data))
+                # Shared list: also visible via inventory.get_all('seeds')
+                add_seed(seed)
+                if log_items:
+                    logging.debug(f"Restored seed: {seed.name} (ID: {seed.id})")
             except Exception as e:
-                logging.warning(f"Failed to restore seed: {e}")
+                seed_failures += 1
+                if log_items:
+                    logging.debug(f"Failed to restore seed: {e}")
         
-        logging.info(f"Total seeds in inventory after restore: {len(self.inventory._items_seeds)}")
-        logging.info(f"Total seeds in harvest_inventory after restore: {len(self.harvest_inventory)}")
+        logging.info(
+            f"Restored {len(seeds_to_restore) - seed_failures}/{len(seeds_to_restore)} seeds "
+            f"({seed_failures} failures)"
+        )
+        if seed_failures:
+            logging.warning(f"Failed to restore {seed_failures} seeds")
         
         self.inventory._items_pollen.clear()
-        for pollen_data in inventory_data.get('pollen', []):
+        pollen_to_restore = inventory_data.get('pollen', [])
+        pollen_failures = 0
+        pollen_state, add_pollen = savefile.pollen_state, self.inventory._items_pollen.append
+        for pollen_data in pollen_to_restore:
             try:
                 # Pollen inherits from InventoryItem(name, id)
-                # Then requires: source_plant, collection_time
-                # Optional: source_id, collected_day, expires_day, genotype, traits
+                # Then has: source_plant, collection_time, source_id,
+                # collected_day, expires_day, genotype, traits
                 
-                # We can't restore source_plant reference, so we pass None
-                # The __post_init__ will be skipped since we provide the metadata directly
-                pollen = Pollen(
-                    name=pollen_data.get('name', f"Pollen_{pollen_data['id']}"),
-                    id=pollen_data['id'],
-                    source_plant=None,  # Can't restore plant reference
-                    collection_time=0,
-                    source_id=pollen_data.get('source_id', 0),
-                    collected_day=pollen_data.get('collected_day', 0),
-                    expires_day=pollen_data.get('expires_day', 0),
-                    genotype=pollen_data.get('genotype', {}),
-                    traits=pollen_data.get('traits', {}),
-                )
-                self.inventory._items_pollen.append(pollen)
+                # We can't restore the source_plant reference (left None).
+                # _from_state skips __post_init__, which would otherwise reset
+                # source_id from that missing plant.
+                pollen = Pollen._from_state(pollen_state(pollen_data))
+                add_pollen(pollen)
             except Exception as e:
-                logging.warning(f"Failed to restore pollen: {e}")
+                pollen_failures += 1
+                if log_items:
+                    logging.debug(f"Failed to restore pollen: {e}")
+        if pollen_failures:
+            logging.warning(
+                f"Failed to restore {pollen_failures}/{len(pollen_to_restore)} pollen packets"
+            )
         
-        # Restore plants
+        # Restore plants; pooled trait dicts are interned once and then
+        # shared by every plant that references them (traits are not
+        # modified after __post_init__, which restore skips)
+        traits_pool = [
+            savefile.intern_traits(t) for t in save_data.get('traits_pool') or ()
+        ]
+        tiles, n_tiles, garden = self.tiles, len(self.tiles), self.garden
+        plant_state, from_state = savefile.plant_state, Plant._from_state
         for plant_data in save_data['plants']:
             tile_idx = plant_data['tile_idx']
             
             # Skip if tile index is out of bounds
-            if tile_idx >= len(self.tiles):
+            if tile_idx >= n_tiles:
                 continue
             
-            tile = self.tiles[tile_idx]
+            tile = tiles[tile_idx]
             
-            # Create plant (using Plant constructor with minimal args)
-            plant = Plant(
-                id=plant_data['id'],
-                env=self.garden,
-                generation=plant_data['generation'],
-            )
-            
-            # Restore all plant attributes
-            plant.stage = plant_data['stage']
-            plant.alive = plant_data['alive']
-            plant.days_since_planting = plant_data['days_since_planting']
-            plant.health = plant_data['health']
-            plant.water = plant_data['water']
-            plant.traits = plant_data['traits']
-            plant.revealed_traits = plant_data['revealed_traits']
-            plant.reveal_order = plant_data['reveal_order']
-            plant.entered_stage5_age = plant_data.get('entered_stage5_age')
-            plant.max_age_days = plant_data['max_age_days']
-            plant.senescent = plant_data['senescent']
-            plant.germination_delay = plant_data['germination_delay']
-            plant.pending_cross = plant_data.get('pending_cross')
-            plant.pollinated = plant_data['pollinated']
-            plant.emasculated = plant_data['emasculated']
-            plant.emasc_day = plant_data.get('emasc_day')
-            plant.emasc_phase = plant_data.get('emasc_phase')
-            plant.selfing_frac_before_emasc = plant_data['selfing_frac_before_emasc']
-            plant.pods_total = plant_data['pods_total']
-            plant.pods_remaining = plant_data['pods_remaining']
-            plant.ovules_per_pod = plant_data['ovules_per_pod']
-            plant.ovules_left = plant_data['ovules_left']
-            plant.aborted_ovules = plant_data['aborted_ovules']
-            plant.fully_harvested = plant_data.get('fully_harvested', False)
-            plant.ancestry = plant_data['ancestry']
-            plant.paternal_ancestry = plant_data['paternal_ancestry']
-            if plant_data.get('genotype'):
-                plant.genotype = plant_data['genotype']
-            plant.last_anther_check_day = plant_data.get('last_anther_check_day')
-            plant.anthers_available_today = plant_data['anthers_available_today']
-            plant.anthers_collected_day = plant_data.get('anthers_collected_day')
-
-            # Restore parentage (dynamic attrs — never part of the Plant dataclass)
-            plant.mother_id = plant_data.get('mother_id')
-            plant.father_id = plant_data.get('father_id')
-            plant.selfed    = plant_data.get('selfed', False)
-            plant.is_weak              = plant_data.get('is_weak', False)
-            plant.weak_blocks_flowering = plant_data.get('weak_blocks_flowering', False)
-            plant.late_season_stress    = plant_data.get('late_season_stress', False)
-            # Restore pod provenance so TIE can group siblings by pod
-            spidx = plant_data.get('source_pod_index')
-            if spidx is not None:
-                plant.source_pod_index = int(spidx)
+            # Rebuild the plant straight from its record: Plant._from_state
+            # skips __post_init__'s random draws, which would all be
+            # overwritten here anyway
+            plant = from_state(garden, plant_state(plant_data, traits_pool))
 
             tile.plant = plant
+            dirty_tiles.add(tile_idx)
 
         # Re-sync used_ids from all restored sources so new plants never reuse IDs
         if not hasattr(self, 'used_ids'):
@@ -7521,8 +7657,11 @@ class GardenApp:
         except Exception:
             pass
         
-        # Update UI
-        self.render_all()
+        # The loaded date usually differs from the previous one
+        self._season_poll()
+
+        # Update UI (empty tiles that stayed empty keep their drawing)
+        self.render_tiles(sorted(dirty_tiles))
         self._update_temp_button_state()
         
         # Update seed counter display
@@ -7537,6 +7676,32 @@ class GardenApp:
             text=("⏸ Pause" if self.running else "▶ Resume")
         )
 
+    def _legend_swatches(self, items, row_h=26):
+        """
+        Column of outlined 20x20 colour swatches for a Help legend.
+
+        Built once per legend and kept for the lifetime of the app, so
+        reopening Help reuses the image instead of redrawing each swatch.
+
+        Args:
+            items: Tuple of (colour, label) rows
+            row_h: Vertical distance between swatches in pixels
+
+        Returns:
+            tk.PhotoImage, 21 px wide and len(items) * row_h tall
+        """
+        cache = self._help_legend_imgs
+        key = (items, row_h)
+        img = cache.get(key)
+        if img is None:
+            img = tk.PhotoImage(master=self.root, width=21, height=len(items) * row_h)
+            for i, (color, _) in enumerate(items):
+                y = i * row_h
+                img.put("black", to=(0, y, 21, y + 21))
+                img.put(color, to=(1, y + 1, 20, y + 20))
+            cache[key] = img
+        return img
+
     def _show_help(self):
         # --- Window ---
         top = Toplevel(self.root)
@@ -7564,7 +7729,10 @@ class GardenApp:
 # Event Handlers
 # ============================================================================
         def _on_configure(event):
+            if building[0]:
+                return  # _build_visible updates the scrollregion itself
             canvas.configure(scrollregion=canvas.bbox("all"))
+            _build_visible()
 
         inner.bind("<Configure>", _on_configure)
 
@@ -7575,175 +7743,249 @@ class GardenApp:
             except Exception:
                 pass
 
-        canvas.bind_all("<MouseWheel>", _on_mousewheel)
-
-        BODY_FONT = ("Segoe UI", 11)
-        SUBHEAD_FONT = ("Segoe UI", 12, "bold")
-        HEAD_FONT = ("Segoe UI", 13, "bold")
+        # Bound globally only while the pointer is over this canvas, and
+        # released when the Help window closes
+        def _unbind_wheel(event=None):
+            try:
+                canvas.unbind_all("<MouseWheel>")
+            except Exception:
+                pass
 
-        def add_paragraph(text, padx=20, pady=(0, 6)):
-            tk.Label(inner, text=text, font=BODY_FONT, wraplength=480, justify="left")\
+        canvas.bind("<Enter>", lambda e: canvas.bind_all("<MouseWheel>", _on_mousewheel))
+        canvas.bind("<Leave>", _unbind_wheel)
+        canvas.bind("<Destroy>", _unbind_wheel)
+
+        # Font objects are resolved by Tk once and shared by every label; the
+        # window keeps references (a collected Font deletes the Tk font)
+        BODY_FONT = tkfont.Font(top, family="Segoe UI", size=11)
+        BOLD_FONT = tkfont.Font(top, family="Segoe UI", size=11, weight="bold")
+        SUBHEAD_FONT = tkfont.Font(top, family="Segoe UI", size=12, weight="bold")
+        HEAD_FONT = tkfont.Font(top, family="Segoe UI", size=13, weight="bold")
+        TITLE_FONT = tkfont.Font(top, family="Segoe UI", size=16, weight="bold")
+        top._help_fonts = (BODY_FONT, BOLD_FONT, SUBHEAD_FONT, HEAD_FONT, TITLE_FONT)
+
+        def add_paragraph(parent, text, padx=20, pady=(0, 6)):
+            tk.Label(parent, text=text, font=BODY_FONT, wraplength=480, justify="left")\
               .pack(anchor="w", padx=padx, pady=pady)
 
-        def add_bullets(lines, padx=20):
+        def add_bullets(parent, lines, padx=20):
             for line in lines:
-                tk.Label(inner, text="• " + line, font=BODY_FONT, wraplength=480, justify="left")\
+                tk.Label(parent, text="• " + line, font=BODY_FONT, wraplength=480, justify="left")\
                   .pack(anchor="w", padx=padx)
 
+        def add_legend(parent, items, row_h=26):
+            # One canvas per legend: the swatch column is a single cached
+            # image, the labels are canvas text items
+            legend = tk.Canvas(parent, width=480, height=len(items) * row_h,
+                               highlightthickness=0)
+            legend.create_image(1, 2, image=self._legend_swatches(items, row_h), anchor="nw")
+            for i, (_, label) in enumerate(items):
+                legend.create_text(30, i * row_h + 12, text=label, anchor="w", font=BODY_FONT)
+            legend.pack(anchor="w", padx=20)
+
+        # --- Lazy sections ---
+        # Each section below is a builder; it starts as an empty placeholder
+        # frame of roughly its final height (keeps the scrollregion stable)
+        # and its widgets are only created once it scrolls into view.
+        sections = []  # [placeholder, builder, built]
+        building = [False]  # suspends _on_configure while sections are built
+
+        def add_section(est_height, builder):
+            ph = tk.Frame(inner, height=est_height, width=500)
+            ph.pack_propagate(False)
+            ph.pack(anchor="w", fill="x")
+            sections.append([ph, builder, False])
+
+        def _build_visible(event=None):
+            if building[0]:
+                return
+            try:
+                view_top = canvas.canvasy(0)
+                view_bottom = view_top + canvas.winfo_height()
+            except tk.TclError:
+                return  # window already closed
+            built_any = False
+            building[0] = True
+            try:
+                for sec in sections:
+                    ph, builder, built = sec
+                    if built:
+                        continue
+                    y = ph.winfo_y()
+                    if y > view_bottom:
+                        break
+                    if y + ph.winfo_height() >= view_top:
+                        builder(ph)
+                        ph.pack_propagate(True)  # grow to the real content
+                        sec[2] = True
+                        built_any = True
+                if built_any:
+                    # One geometry pass and one scrollregion update for the
+                    # whole batch instead of one per packed widget
+                    inner.update_idletasks()
+                    canvas.configure(scrollregion=canvas.bbox("all"))
+            finally:
+                building[0] = False
+
+        def _on_yscroll(first, last):
+            vscroll.set(first, last)
+            _build_visible()
+
+        canvas.configure(yscrollcommand=_on_yscroll)
+        canvas.bind("<Configure>", _build_visible)
+
         # ============================================================
         # ======================  HELP CONTENT  ======================
         # ============================================================
 
         # --- Title ---
-        tk.Label(inner, text="Help / Legend", font=("Segoe UI", 16, "bold")).pack(pady=(10, 10))
+        tk.Label(inner, text="Help / Legend", font=TITLE_FONT).pack(pady=(10, 10))
 
         # ------------------------------------------------------------
         # HEALTH COLORS
         # ------------------------------------------------------------
-        tk.Label(inner, text="🌿 Health Levels", font=("Segoe UI", 13, "bold")).pack(anchor="w", padx=10)
-
-        health_items = [
-            ("#0c0", "Healthy (81–100)"),
-            ("#6f6", "Okay (61–80)"),
-            ("#ff0", "Stressed (41–60)"),
-            ("#f90", "Critical (21–40)"),
-            ("#f33", "Dying (1–20)"),
-            ("#666", "Dead (0)")
-        ]
+        def _build_health(parent):
+            tk.Label(parent, text="🌿 Health Levels", font=HEAD_FONT).pack(anchor="w", padx=10)
+
+            add_legend(parent, _HELP_HEALTH_LEGEND)
 
-        for color, label in health_items:
-            f = tk.Frame(inner)
-            f.pack(anchor='w', padx=20)
-            c = tk.Canvas(f, width=20, height=20, highlightthickness=1)
-            c.create_rectangle(0, 0, 20, 20, fill=color, width=0)
-            c.pack(side=tk.LEFT)
-            tk.Label(f, text=label, font=("Segoe UI", 11)).pack(side=tk.LEFT, padx=6)
+        add_section(180, _build_health)
 
         # ------------------------------------------------------------
         # WATER BAR
         # ------------------------------------------------------------
-        tk.Label(inner, text="💧 Water Bar", font=("Segoe UI", 13, "bold")).pack(anchor="w", padx=10, pady=(10, 0))
+        def _build_water(parent):
+            tk.Label(parent, text="💧 Water Bar", font=HEAD_FONT).pack(anchor="w", padx=10, pady=(10, 0))
 
-        tk.Label(
-            inner,
-            text="Left vertical blue bar shows water level (0–100). "
-                 "100 does NOT fill the tile completely (75% max) to avoid overflow effects.",
-            wraplength=480,
-            justify="left"
-        ).pack(anchor="w", padx=20, pady=(0, 6))
+            tk.Label(
+                parent,
+                text="Left vertical blue bar shows water level (0–100). "
+                     "100 does NOT fill the tile completely (75% max) to avoid overflow effects.",
+                wraplength=480,
+                justify="left"
+            ).pack(anchor="w", padx=20, pady=(0, 6))
+
+        add_section(80, _build_water)
 
         # ------------------------------------------------------------
         # SOIL MOISTURE COLORS
         # ------------------------------------------------------------
-        tk.Label(inner, text="🌱 Soil Moisture Colors", font=("Segoe UI", 13, "bold")).pack(anchor="w", padx=10, pady=(10, 0))
-
-        soil_items = [
-            ("#FFD54F", "Dry (0–25)"),
-            ("#81D4FA", "Slightly moist (26–50)"),
-            ("#42A5F5", "Evenly moist (51–75)"),
-            ("#1565C0", "Soggy (76–90)"),
-            ("#003F8C", "Waterlogged (91–100)")
-        ]
+        def _build_soil(parent):
+            tk.Label(parent, text="🌱 Soil Moisture Colors", font=HEAD_FONT).pack(anchor="w", padx=10, pady=(10, 0))
 
-        for color, label in soil_items:
-            f = tk.Frame(inner)
-            f.pack(anchor="w", padx=20)
-            c = tk.Canvas(f, width=20, height=20, highlightthickness=1)
-            c.create_rectangle(0, 0, 20, 20, fill=color, width=0)
-            c.pack(side=tk.LEFT)
-            tk.Label(f, text=label, font=("Segoe UI", 11)).pack(side=tk.LEFT, padx=6)
+            add_legend(parent, _HELP_SOIL_LEGEND)
+
+        add_section(160, _build_soil)
 
         # ------------------------------------------------------------
         # TIPS
         # ------------------------------------------------------------
-        tk.Label(inner, text="⚠️ Tips", font=("Segoe UI", 13, "bold")).pack(anchor="w", padx=10, pady=(12, 0))
-
-        tips = [
-            "Water only morning or evening to avoid heat stress.",
-            "Rain gently increases water level and blocks manual watering.",
-            "Overwatering (>85) slowly damages plants.",
-            "Very wet soil (>95) damages plants strongly.",
-            "Plants with poor health (≤20) might die at phase transitions.",
-            "Temperature changes gradually over the day.",
-        ]
+        def _build_tips(parent):
+            tk.Label(parent, text="⚠️ Tips", font=HEAD_FONT).pack(anchor="w", padx=10, pady=(12, 0))
+
+            tips = [
+                "Water only morning or evening to avoid heat stress.",
+                "Rain gently increases water level and blocks manual watering.",
+                "Overwatering (>85) slowly damages plants.",
+                "Very wet soil (>95) damages plants strongly.",
+                "Plants with poor health (≤20) might die at phase transitions.",
+                "Temperature changes gradually over the day.",
+            ]
 
-        for t in tips:
-            tk.Label(inner, text="• " + t, wraplength=480, justify="left").pack(anchor="w", padx=20)
+            for t in tips:
+                tk.Label(parent, text="• " + t, wraplength=480, justify="left").pack(anchor="w", padx=20)
+
+        add_section(160, _build_tips)
 
         # ------------------------------------------------------------
         # KEYBOARD SHORTCUTS
         # ------------------------------------------------------------
-        tk.Label(inner, text="⌨️ Keyboard Shortcuts", font=("Segoe UI", 13, "bold")).pack(anchor="w", padx=10, pady=(12, 0))
-
-        shortcuts = [
-            ("H", "Help / Legend"),
-            ("W", "Water all plants"),
-            ("w", "Water selected plant"),
-            ("F", "Fast Forward mode"),
-            ("Space / P", "Pause / Resume day cycle"),
-            ("Arrow keys", "Move selection"),
-            ("Enter", "Inspect selected plant"),
-            ("X / Del", "Remove selected plant"),
-            ("Shift+X", "Remove ALL plants"),
-            ("E", "Emasculate selected plant"),
-            ("C", "Collect pollen"),
-            ("O", "Perform pollination"),
-            ("Shift+O", "Open Summary → Pollen"),
-            ("S", "Harvest seeds (one pod)"),
-            ("Shift+S", "Harvest ALL seeds (remove plant)"),
-            ("N", "Plant from harvested seeds"),
-            ("L", "Open Mendel’s Notebook"),
-            ("G", "Toggle garden background"),
-            ("Ctrl+G", "Show genotype viewer"),
-        ]
+        def _build_shortcuts(parent):
+            tk.Label(parent, text="⌨️ Keyboard Shortcuts", font=HEAD_FONT).pack(anchor="w", padx=10, pady=(12, 0))
+
+            shortcuts = [
+                ("H", "Help / Legend"),
+                ("W", "Water all plants"),
+                ("w", "Water selected plant"),
+                ("F", "Fast Forward mode"),
+                ("Space / P", "Pause / Resume day cycle"),
+                ("Arrow keys", "Move selection"),
+                ("Enter", "Inspect selected plant"),
+                ("X / Del", "Remove selected plant"),
+                ("Shift+X", "Remove ALL plants"),
+                ("E", "Emasculate selected plant"),
+                ("C", "Collect pollen"),
+                ("O", "Perform pollination"),
+                ("Shift+O", "Open Summary → Pollen"),
+                ("S", "Harvest seeds (one pod)"),
+                ("Shift+S", "Harvest ALL seeds (remove plant)"),
+                ("N", "Plant from harvested seeds"),
+                ("L", "Open Mendel’s Notebook"),
+                ("G", "Toggle garden background"),
+                ("Ctrl+G", "Show genotype viewer"),
+            ]
 
-        for key, text in shortcuts:
-            row = tk.Frame(inner)
-            row.pack(anchor="w", padx=20)
-            tk.Label(row, text=f"{key}:", font=("Segoe UI", 11, "bold")).pack(side=tk.LEFT, padx=(0, 6))
-            tk.Label(row, text=text, font=("Segoe UI", 11)).pack(side=tk.LEFT)
+            # One read-only Text with tagged runs instead of a Frame and two
+            # Labels per row
+            table = tk.Text(parent, height=len(shortcuts), width=55, wrap="none",
+                            bd=0, highlightthickness=0, cursor="arrow",
+                            bg=parent.cget("bg"), font=BODY_FONT)
+            table.tag_configure("key", font=BOLD_FONT)
+            for key, text in shortcuts:
+                table.insert("end", f"{key}: ", "key")
+                table.insert("end", f"{text}\n")
+            table.delete("end-2c")  # trailing newline would add an empty row
+            table.configure(state="disabled")
+            table.pack(anchor="w", padx=20)
+
+        add_section(470, _build_shortcuts)
 
         # ------------------------------------------------------------
         # REPRODUCTION: EMASCULATION / POLLINATION / POLLEN
         # ------------------------------------------------------------
-        tk.Label(inner, text="Reproduction: Emasculation & Pollination", font=HEAD_FONT)\
-          .pack(anchor="w", padx=10, pady=(12, 0))
-
-        add_paragraph("Reproductive actions are possible once a plant reaches the Budding/Flowering stage.")
-
-        tk.Label(inner, text="Emasculation", font=SUBHEAD_FONT)\
-          .pack(anchor="w", padx=20, pady=(6, 0))
-
-        add_bullets([
-            "Emasculation means removing the male organs (anthers) from a flower to prevent further self-fertilization.",
-            "It can be done during the Budding/Flowering stage (early or late), but only once per plant.",
-            "Timing matters: peas often self-fertilize before the flower opens.",
-            "Early emasculation leaves most ovules unfertilized; late emasculation has a high risk that selfing already occurred.",
-            "Emasculation cannot undo self-fertilization that already happened — it only reduces additional selfing afterwards.",
-        ], padx=30)
-
-        tk.Label(inner, text="Pollination", font=SUBHEAD_FONT)\
-          .pack(anchor="w", padx=20, pady=(10, 0))
-
-        add_bullets([
-            "Pollination means applying pollen to the female part of a flower.",
-            "It can be done during Flowering.",
-            "Emasculation is optional, but recommended for controlled crosses (to reduce selfing).",
-            "After successful pollination, pods develop and mature seeds can later be harvested.",
-        ], padx=30)
-
-        tk.Label(inner, text="Pollen availability", font=SUBHEAD_FONT)\
-          .pack(anchor="w", padx=20, pady=(10, 0))
-
-        add_bullets([
-            "Flowering plants do not produce collectable pollen every day.",
-            "Pollen availability is determined once per flowering day.",
-            "Inspecting a flowering plant shows today’s pollen status.",
-            "Status messages: “Pollen available” (can collect today) or “No pollen available” (try another day).",
-        ], padx=30)
+        def _build_reproduction(parent):
+            tk.Label(parent, text="Reproduction: Emasculation & Pollination", font=HEAD_FONT)\
+              .pack(anchor="w", padx=10, pady=(12, 0))
+
+            add_paragraph(parent, "Reproductive actions are possible once a plant reaches the Budding/Flowering stage.")
+
+            tk.Label(parent, text="Emasculation", font=SUBHEAD_FONT)\
+              .pack(anchor="w", padx=20, pady=(6, 0))
+
+            add_bullets(parent, [
+                "Emasculation means removing the male organs (anthers) from a flower to prevent further self-fertilization.",
+                "It can be done during the Budding/Flowering stage (early or late), but only once per plant.",
+                "Timing matters: peas often self-fertilize before the flower opens.",
+                "Early emasculation leaves most ovules unfertilized; late emasculation has a high risk that selfing already occurred.",
+                "Emasculation cannot undo self-fertilization that already happened — it only reduces additional selfing afterwards.",
+            ], padx=30)
+
+            tk.Label(parent, text="Pollination", font=SUBHEAD_FONT)\
+              .pack(anchor="w", padx=20, pady=(10, 0))
+
+            add_bullets(parent, [
+                "Pollination means applying pollen to the female part of a flower.",
+                "It can be done during Flowering.",
+                "Emasculation is optional, but recommended for controlled crosses (to reduce selfing).",
+                "After successful pollination, pods develop and mature seeds can later be harvested.",
+            ], padx=30)
+
+            tk.Label(parent, text="Pollen availability", font=SUBHEAD_FONT)\
+              .pack(anchor="w", padx=20, pady=(10, 0))
+
+            add_bullets(parent, [
+                "Flowering plants do not produce collectable pollen every day.",
+                "Pollen availability is determined once per flowering day.",
+                "Inspecting a flowering plant shows today’s pollen status.",
+                "Status messages: “Pollen available” (can collect today) or “No pollen available” (try another day).",
+            ], padx=30)
+
+        add_section(520, _build_reproduction)
 
     def _prev_generation(self, gen: str) -> str:
-        m = re.match(r"F(\d+)", str(gen or "F0"))
+        if not gen:
+            return "F0"
+        m = _GEN_RE.match(str(gen))
         try:
             n = int(m.group(1)) if m else 0
             return f"F{max(0, n-1)}"
@@ -7751,7 +7993,9 @@ class GardenApp:
             return "F0"
 
     def _next_generation(self, gen: str) -> str:
-        m = re.match(r"F(\d+)", str(gen or "F0"))
+        if not gen:
+            return "F1"
+        m = _GEN_RE.match(str(gen))
     
         try:
             n = int(m.group(1)) if m else 0
@@ -7763,9 +8007,12 @@ class GardenApp:
         try:
             if not hasattr(self, "used_ids"):
                 self.used_ids = set()
+            # next_plant_id is kept above every used id (__init__ and load
+            # both sync it), so allocation is a plain increment. On a
+            # collision, jump past the maximum once instead of probing.
             pid = self.next_plant_id
-            while pid in self.used_ids:
-                pid += 1
+            if pid in self.used_ids:
+                pid = max(self.used_ids) + 1
             self.used_ids.add(pid)
             self.next_plant_id = pid + 1
             return pid
@@ -7801,16 +8048,19 @@ class GardenApp:
         }
 
     def _find_plant(self, pid):
+        # Registered plants: O(1) via the garden's id index
         try:
-            if hasattr(self, "_get_plant_by_id"):
-                p = self._get_plant_by_id(pid)
-                if p is not None:
-                    return p
+            p = self.garden.plants_by_id.get(pid)
+            if p is not None:
+                return p
         except Exception:
             pass
+        # Slow path for anything outside the registry (garden.plants itself
+        # needs no scan: plants_by_id mirrors it)
         try:
-            for p in getattr(self.garden, "plants", []) or []:
-                if p is not None and getattr(p, "id", None) == pid:
+            if hasattr(self, "_get_plant_by_id"):
+                p = self._get_plant_by_id(pid)
+                if p is not None:
                     return p
         except Exception:
             pass
@@ -7827,31 +8077,8 @@ class GardenApp:
             pass
         return None
 
-    def _season_register_live(self, sim_date):
-        try:
-            for p in getattr(self.garden, "plants", []) or []:
-                if p is None or not getattr(p, "alive", True):
-                    continue
-                pid = getattr(p, "id", None)
-                if pid is None or pid in getattr(self, "_season_registered", set()):
-                    continue
-                sow_date = getattr(p, "sow_date", None)
-                if not sow_date:
-                    try:
-                        sow_date = sim_date
-                        setattr(p, "sow_date", sow_date)
-                    except Exception:
-                        sow_date = sim_date
-                try:
-                    self._season.register_plant(pid, sow_date)
-                    self._season_registered.add(pid)
-                except Exception:
-                    pass
-        except Exception:
-            pass
-
     def _season_daily_update(self, sim_date):
-        mode = str(getattr(self, "_season_mode", "off")).lower()
+        mode = getattr(self, "_season_mode", "off")
         if mode not in ("overlay", "enforce"):
             return
 
@@ -7885,43 +8112,50 @@ class GardenApp:
                 pid = getattr(plant, "id", None)
                 if late_onset and not getattr(plant, "late_season_stress", False):
                     plant.late_season_stress = True
-                    try:
-                        self._toast(f"Plant #{pid} showing late-season stress.", level="warn")
-                    except Exception:
-                        pass
+                    self._toast(f"Plant #{pid} showing late-season stress.", level="warn")
                 if daily_damage > 0:
                     cur = int(getattr(plant, "health", 100))
                     new_h = max(0, cur - daily_damage)
                     plant.health = new_h
                     if new_h <= 0:
                         plant.alive = False
-                        try:
-                            plant.death_day = self._get_current_day_number()
-                            self.archive_snapshot(plant)
-                        except Exception:
-                            pass
+                        plant.death_day = self._get_current_day_number()
+                        self.archive_snapshot(plant)
                         _cause = ("killed by January frost" if m == 1
                                   else "killed by December freeze" if m == 12
                                   else "died from autumn cold")
-                        try:
-                            self._toast(f"Plant #{pid} {_cause}.", level="warn")
-                        except Exception:
-                            pass
+                        self._toast(f"Plant #{pid} {_cause}.", level="warn")
 
         try:
             try:
                 self._season.update_soil(sim_date)
             except Exception:
                 pass
-            self._season_register_live(sim_date)
-            ids = []
-            try:
-                for p in getattr(self.garden, "plants", []) or []:
-                    if p is not None and getattr(p, "alive", True):
-                        ids.append(getattr(p, "id", None))
-            except Exception:
-                pass
-            ids = [i for i in ids if i is not None]
+            # One pass over the garden: register newly seen live plants with
+            # the season model and index them by id, so events are resolved
+            # with one dict lookup each instead of a _find_plant() scan
+            live_by_id = {}
+            registered = self._season_registered
+            register = self._season.register_plant
+            plants = getattr(self.garden, "plants", None) or []
+            for p in plants:
+                if p is None or not getattr(p, "alive", True):
+                    continue
+                pid = getattr(p, "id", None)
+                if pid is None:
+                    continue
+                live_by_id[pid] = p
+                if pid in registered:
+                    continue
+                sow_date = getattr(p, "sow_date", None)
+                if not sow_date:
+                    sow_date = p.sow_date = sim_date
+                try:
+                    register(pid, sow_date)
+                    registered.add(pid)
+                except Exception:
+                    pass
+            ids = list(live_by_id)
             if not ids:
                 return
             events = []
@@ -7930,13 +8164,14 @@ class GardenApp:
             except Exception:
                 events = []
             for ev in events or []:
-                try:
-                    if str(ev.get('type','')).lower() == 'senescence_start':
-                        self._toast(f"Plant #{ev.get('plant_id')} entered senescence")
-                except Exception:
-                    pass
+                # Event type is normalised once and reused by every branch below
+                etype = str(ev.get("type", "")).lower()
                 pid = ev.get("plant_id")
-                plant = self._find_plant(pid)
+                if etype == "senescence_start":
+                    self._toast(f"Plant #{pid} entered senescence")
+                plant = live_by_id.get(pid)
+                if plant is None:
+                    plant = self._find_plant(pid)
                 if plant is None:
                     continue
                 
@@ -7944,98 +8179,68 @@ class GardenApp:
                 if not getattr(plant, "alive", False):
                     continue
                 
-                try:
-                    delta = int(ev.get("suggested_health_delta", 12) or 0)
-                except Exception:
-                    delta = 0
+                delta = ev.get("suggested_health_delta", 12) or 0
+                delta = int(delta) if isinstance(delta, (int, float)) else 0
 
                 # Apply health delta — cap non-lethal events to -12 per day so the
                 # season model cannot instant-kill plants with a single large delta.
                 # Harvest-stage plants (6-7) are protected to health=1 minimum.
                 if delta < 0:
-                    try:
-                        etype = str(ev.get("type", "")).lower()
-                        # Only true freeze events bypass the per-event damage cap.
-                        # "wither" (natural lifespan cap) uses -9999 but is not a
-                        # freeze event — apply the cap so it drains health over days.
-                        is_lethal = ("lethal" in etype or "freeze" in etype)
-                        if not is_lethal:
-                            delta = max(delta, -12)
-                        cur = int(getattr(plant, "health", 100))
-                        # Protect plants that are actively harvestable (have pods).
-                        # Once pods are gone or fully harvested, no floor — natural death allowed.
-                        pods_left = int(getattr(plant, "pods_remaining", 0) or 0)
-                        fully_done = getattr(plant, "fully_harvested", False)
-                        at_harvest = (int(getattr(plant, "stage", 0)) >= 6
-                                      and pods_left > 0 and not fully_done)
-                        floor = 1 if (at_harvest and not is_lethal) else 0
-                        new_health = max(floor, cur + delta)
-                        setattr(plant, "health", new_health)
-                        if new_health <= 0 and getattr(plant, "alive", True):
-                            plant.alive = False
-                            plant.death_day = self._get_current_day_number()
-                            try:
-                                self.archive_snapshot(plant)
-                            except Exception:
-                                pass
-                            try:
-                                if "critical_stress" in etype or "chronic" in etype:
-                                    death_msg = f"Plant #{pid} died from prolonged stress"
-                                elif "senescent" in etype:
-                                    death_msg = f"Plant #{pid} died of old age"
-                                elif is_lethal:
-                                    death_msg = f"Plant #{pid} killed by freeze"
-                                else:
-                                    death_msg = f"Plant #{pid} died from health failure"
-                                self._toast(death_msg, level="warning")
-                            except Exception:
-                                pass
-                    except Exception:
-                        pass
+                    # Only true freeze events bypass the per-event damage cap.
+                    # "wither" (natural lifespan cap) uses -9999 but is not a
+                    # freeze event — apply the cap so it drains health over days.
+                    is_lethal = ("lethal" in etype or "freeze" in etype)
+                    if not is_lethal:
+                        delta = max(delta, -12)
+                    cur = int(getattr(plant, "health", 100))
+                    # Protect plants that are actively harvestable (have pods).
+                    # Once pods are gone or fully harvested, no floor — natural death allowed.
+                    pods_left = int(getattr(plant, "pods_remaining", 0) or 0)
+                    fully_done = getattr(plant, "fully_harvested", False)
+                    at_harvest = (int(getattr(plant, "stage", 0)) >= 6
+                                  and pods_left > 0 and not fully_done)
+                    floor = 1 if (at_harvest and not is_lethal) else 0
+                    new_health = max(floor, cur + delta)
+                    plant.health = new_health
+                    if new_health <= 0:
+                        # (alive was checked above and nothing since revived it)
+                        plant.alive = False
+                        plant.death_day = self._get_current_day_number()
+                        self.archive_snapshot(plant)
+                        cause = next(
+                            (c for keys, c in _SEASON_DEATH_CAUSES
+                             if any(k in etype for k in keys)),
+                            "killed by freeze" if is_lethal else "died from health failure",
+                        )
+                        self._toast(f"Plant #{pid} {cause}", level="warning")
                 
                 # Only true lethal_freeze events cause instant death.
                 # "wither" events (natural lifespan cap) use -9999 delta but are
                 # NOT freeze — they should drain health gradually, not kill instantly.
-                try:
-                    t = str(ev.get("type", "")).lower()
-                    is_true_freeze = (t == "lethal_freeze")
-                except Exception:
-                    is_true_freeze = False
-
-                if is_true_freeze:
-                    try:
-                        if getattr(plant, "alive", False):
-                            plant.alive = False
-                            plant.death_day = self._get_current_day_number()
-                            if hasattr(plant, "health"):
-                                plant.health = 0
-                            try:
-                                self.archive_snapshot(plant)
-                            except Exception:
-                                pass
-                            try:
-                                self._toast(
-                                    f"Plant #{pid} killed by freeze — {ev.get('message','')}",
-                                    level="warning")
-                            except Exception:
-                                pass
-                    except Exception:
-                        pass
+                if etype == "lethal_freeze" and getattr(plant, "alive", False):
+                    plant.alive = False
+                    plant.death_day = self._get_current_day_number()
+                    if hasattr(plant, "health"):
+                        plant.health = 0
+                    self.archive_snapshot(plant)
+                    self._toast(
+                        f"Plant #{pid} killed by freeze — {ev.get('message','')}",
+                        level="warning")
         except Exception:
             pass
 
     def _season_poll(self):
+        """Run the daily season update if the simulated date has changed.
+
+        Called right after each garden.next_phase() and after loading a save,
+        instead of from a timer: most polls would find the date unchanged.
+        """
         try:
-            sim_date = dt.date(int(getattr(self.garden, "year")), int(getattr(self.garden, "month")), int(getattr(self.garden, "day_of_month")))
+            sim_date = self.garden.current_date
         except Exception:
             sim_date = None
-        last = getattr(self, "_season_last_date", None)
-        if sim_date is not None and sim_date != last:
-            self._season_last_date = sim_date
-            try:
-                self._season_daily_update(sim_date)
-            except Exception:
-                pass
+        if sim_date is not None and sim_date != getattr(self, "_season_last_date", None):
+            self._on_garden_date_changed(sim_date)
         # NOTE: The intra-day lethal-polling block has been removed.
         # It called can_grow() every 500ms and triggered _season_apply_hourly_lethal
         # + double _season_daily_update when can_grow returned any "lethal" string —
@@ -8043,8 +8248,12 @@ class GardenApp:
         # to zero within seconds.  True lethal events (frost/freeze) are now handled
         # exclusively by _season_daily_update on day change, which is the correct
         # granularity for a daily simulation.
+
+    def _on_garden_date_changed(self, new_date):
+        """Apply the season model for a new simulated date."""
+        self._season_last_date = new_date
         try:
-            self.root.after(500, self._season_poll)
+            self._season_daily_update(new_date)
         except Exception:
             pass
 
@@ -8058,28 +8267,18 @@ class GardenApp:
         if last is None or (now_ms - int(last)) >= interval:
             self._season_last_hourly_tick = now_ms
             pts = int(points_per_hour) if isinstance(points_per_hour, (int, float)) else -20
-            for plant in getattr(self.garden, 'plants', []) or []:
-                if plant is None or not getattr(plant, 'alive', True):
-                    continue
-                try:
-                    h = int(getattr(plant, 'health', 100))
-                except Exception:
-                    h = 100
+            # Only the live plants are touched; collect them in one pass
+            live = [p for p in getattr(self.garden, 'plants', []) or []
+                    if p is not None and getattr(p, 'alive', True)]
+            for plant in live:
+                h = getattr(plant, 'health', 100)
+                h = int(h) if isinstance(h, (int, float)) else 100
                 newh = max(0, h + pts)
-                try:
-                    plant.health = newh
-                except Exception:
-                    pass
+                plant.health = newh
                 if newh <= 0:
-                    try:
-                        plant.alive = False
-                        plant.death_day = self._get_current_day_number()  # Track when plant died
-                        try:
-                            self.archive_snapshot(plant)  # preserve full data before it's gone
-                        except Exception:
-                            pass
-                    except Exception:
-                        pass
+                    plant.alive = False
+                    plant.death_day = self._get_current_day_number()  # Track when plant died
+                    self.archive_snapshot(plant)  # preserve full data before it's gone
             try:
                 self.render_all()
             except Exception:
@@ -8110,6 +8309,11 @@ class GardenApp:
             if not plants:
                 return  # No plants to update
             
+            # Target range is the same for every plant; source ranges are
+            # looked up once per distinct old difficulty
+            new_min, new_max = get_lifecycle_settings(new_mode)["max_age_range"]
+            old_ranges = {}
+            
             # Update each plant
             for plant in plants:
                 old_difficulty = getattr(plant, 'difficulty', 'off')
@@ -8118,11 +8322,11 @@ class GardenApp:
                 plant.difficulty = new_mode
                 
                 # Proportionally scale max_age to new difficulty range
-                old_settings = get_lifecycle_settings(old_difficulty)
-                new_settings = get_lifecycle_settings(new_mode)
-                
-                old_min, old_max = old_settings["max_age_range"]
-                new_min, new_max = new_settings["max_age_range"]
+                old_range = old_ranges.get(old_difficulty)
+                if old_range is None:
+                    old_range = old_ranges[old_difficulty] = \
+                        get_lifecycle_settings(old_difficulty)["max_age_range"]
+                old_min, old_max = old_range
                 
                 current_max_age = getattr(plant, 'max_age_days', old_min)
                 
@@ -8208,39 +8412,25 @@ class GardenApp:
         shows a toast explaining why and returns False. Safe to call even if the
         season module is not installed or is disabled.
         """
+        # Casual mode (the default) allows sowing without consulting the model.
+        # _season_mode is always one of SEASON_MODES, already lower-case.
+        if getattr(self, "_season_mode", "off") not in ("overlay", "enforce"):
+            return True
         try:
-            if hasattr(self, "_season") and str(getattr(self, "_season_mode", "off")).lower() in ("overlay", "enforce"):
-                sim_date = dt.date(
-                    int(getattr(self.garden, 'year', 1866)),
-                    int(getattr(self.garden, 'month', 4)),
-                    int(getattr(self.garden, 'day_of_month', 1))
-                )
-                res = self._season.can_sow(sim_date)
-                ok, why = (res if isinstance(res, tuple) else (bool(res), ""))
-                if not ok:
-                    try:
-                        self._toast(f"Sowing blocked by season model: {why}", level="warn")
-                    except Exception:
-                        pass
-                    return False
+            sim_date = self.garden.current_date
+            res = self._season.can_sow(sim_date)
+            ok, why = (res if isinstance(res, tuple) else (bool(res), ""))
+            if not ok:
+                self._toast(f"Sowing blocked by season model: {why}", level="warn")
+                return False
 
-                # Extra safety: block if climate says it's below 0°C right now (soil/air)
-                try:
-                    temp_now = None
-                    if hasattr(self, '_climate_v2') and self._climate_v2:
-                        # Prefer soil temp if available
-                        temp_now = getattr(self._climate_v2, 'current_soil_temp', None) or getattr(self._climate_v2, 'current_air_temp', None)
-                    if temp_now is None:
-                        # Fallback: garden temp if present
-                        temp_now = getattr(self.garden, 'temp', None)
-                    if isinstance(temp_now, (int, float)) and temp_now < 0:
-                        try:
-                            self._toast(f"Sowing blocked: too cold (current temp {temp_now:.1f}°C).", level="warn")
-                        except Exception:
-                            pass
-                        return False
-                except Exception:
-                    pass
+            # Extra safety: block if it's below 0°C right now. The garden's
+            # drifting air temperature is the current reading (no soil
+            # temperature is modelled)
+            temp_now = self.garden.temp
+            if isinstance(temp_now, (int, float)) and temp_now < 0:
+                self._toast(f"Sowing blocked: too cold (current temp {temp_now:.1f}°C).", level="warn")
+                return False
         except Exception:
             # Any errors: don't hard-crash sowing decision; allow sowing
             pass
@@ -8257,13 +8447,9 @@ class GardenApp:
         # Archive every plant currently in tiles (alive or recently dead)
         # — more complete than garden.plants which only tracks live ones.
         try:
-            for tile in getattr(self, "tiles", []):
-                p = getattr(tile, "plant", None)
-                if p is not None:
-                    try:
-                        self.archive_snapshot(p)
-                    except Exception:
-                        pass
+            self.archive_snapshot_many(
+                p for p in (getattr(t, "plant", None) for t in getattr(self, "tiles", []))
+                if p is not None)
         except Exception:
             pass
         # Also seed from the garden.plants list (fallback / belt-and-suspenders)
@@ -8298,8 +8484,10 @@ class GardenApp:
         try:
             if not hasattr(self, "archive"):
                 self.archive = {}
+                self._archive_fp.clear()
             if "plants" not in self.archive or not isinstance(self.archive["plants"], dict):
                 self.archive["plants"] = {}
+                self._archive_fp.clear()
             # already populated?
             if self.archive["plants"] and not force:
                 return False
@@ -8309,50 +8497,53 @@ class GardenApp:
             if not live:
                 return False
 
-            def get(obj, key, default=None):
-                if isinstance(obj, dict):
-                    return obj.get(key, default)
-                return getattr(obj, key, default)
-
+            arch_plants = self.archive["plants"]
             count = 0
             for p in live:
                 try:
-                    pid = get(p, "id", None)
+                    # One mapping per plant, chosen once: dict records as-is,
+                    # objects through their __dict__ (Plant keeps every field
+                    # there), so each field below is a plain dict lookup
+                    if isinstance(p, dict):
+                        d = p
+                    else:
+                        d = getattr(p, "__dict__", None)
+                        if d is None:
+                            d = {k: getattr(p, k) for k in _ARCHIVE_SNAP_KEYS if hasattr(p, k)}
+                    get = d.get
+                    pid = get("id")
                     if pid is None:
                         continue
                     snap = {
                         "id": pid,
-                        "generation": get(p, "generation", get(p, "gen", "F?")),
-                        "mother_id": get(p, "mother_id", get(p, "motherId", None)),
-                        "father_id": get(p, "father_id", get(p, "fatherId", None)),
-                        "traits": get(p, "traits", {}) or {},
+                        "generation": d["generation"] if "generation" in d else get("gen", "F?"),
+                        "mother_id": d["mother_id"] if "mother_id" in d else get("motherId"),
+                        "father_id": d["father_id"] if "father_id" in d else get("fatherId"),
+                        "traits": get("traits") or {},
                         # Lineage helpers used by the Trait Inheritance Explorer
-                        "ancestry": list(get(p, "ancestry", []) or []),
-                        "paternal_ancestry": list(get(p, "paternal_ancestry", []) or []),
+                        "ancestry": _list_or_empty(get("ancestry")),
+                        "paternal_ancestry": _list_or_empty(get("paternal_ancestry")),
                     }
 
                     # Safety: ensure F0 lineage is never blank in archive-only views
-                    try:
-                        if str(snap.get("generation", "")).upper() == "F0":
-                            if not snap.get("ancestry"):
-                                snap["ancestry"] = [pid]
-                            if not snap.get("paternal_ancestry"):
-                                snap["paternal_ancestry"] = [pid]
-                    except Exception:
-                        pass
-                    geno = get(p, "genotype", None)
+                    if str(snap["generation"]).upper() == "F0":
+                        if not snap["ancestry"]:
+                            snap["ancestry"] = [pid]
+                        if not snap["paternal_ancestry"]:
+                            snap["paternal_ancestry"] = [pid]
+                    geno = get("genotype")
                     if geno:
                         snap["genotype"] = geno
                     else:
                         # preserve genotype from existing archive entry if live plant lost it
-                        existing = self.archive["plants"].get(str(pid)) or self.archive["plants"].get(pid)
+                        existing = arch_plants.get(str(pid)) or arch_plants.get(pid)
                         if isinstance(existing, dict) and existing.get("genotype"):
                             snap["genotype"] = existing["genotype"]
-                    pidx = get(p, "source_pod_index", get(p, "pod_index", None))
+                    pidx = d["source_pod_index"] if "source_pod_index" in d else get("pod_index")
                     if pidx is not None:
                         snap["source_pod_index"] = pidx
                     # Always use str key so it matches the JSON-loaded archive entries
-                    self.archive["plants"][str(pid)] = snap
+                    arch_plants[str(pid)] = snap
                     count += 1
                 except Exception:
                     pass
@@ -8385,6 +8576,7 @@ class GardenApp:
                 return
 
             # ── Pass 1: re-archive live/dead plants still on tiles ────────────
+            stale = []
             for tile in getattr(self, 'tiles', []):
                 p = getattr(tile, 'plant', None)
                 if p is None:
@@ -8394,7 +8586,8 @@ class GardenApp:
                     continue
                 entry = plants.get(pid_s, {})
                 if not entry.get('traits') and getattr(p, 'traits', None):
-                    self.archive_snapshot(p)
+                    stale.append(p)
+            self.archive_snapshot_many(stale)
 
             # ── Pass 2: infer parent traits from children's genotype entries ──
             # Children store mother/father alleles under 'genotype' in some
@@ -8479,94 +8672,91 @@ class GardenApp:
 
     def _set_day_length_patched(self, secs, reschedule=True):
         try:
-            secs = float(secs)
-
-            # Allow very fast speeds but avoid UI lockups
-            if secs < 0.1:
-                secs = 0.1
+            # seconds of real time per simulated HOUR; allow very fast
+            # speeds but avoid UI lockups
+            self.day_length_s = max(0.1, float(secs))
 
-            # seconds of real time per simulated HOUR
-            self.day_length_s = secs
-
-        except Exception:
-            return
-
-        # Recompute derived timers (phase_ms, sub_ms, etc.)
-        try:
+            # Recompute derived timers (phase_ms, sub_ms, etc.)
             self._recalc_timers()
-        except Exception:
-            pass
 
-        # Reschedule the auto-loop so the change takes effect immediately
-        try:
+            # Reschedule the auto-loop so the change takes effect immediately
             if reschedule and not getattr(self, "real_time_mode", False):
-                if getattr(self, "_auto_loop_id", None) is not None:
-                    try:
-                        self.root.after_cancel(self._auto_loop_id)
-                    except Exception:
-                        pass
-                    self._auto_loop_id = None
-
+                self._cancel_auto_loop()
                 self._ensure_auto_loop(delay_ms=max(50, getattr(self, "phase_ms", 600)))
         except Exception:
-            pass
+            return
+
+    def _cancel_auto_loop(self):
+        """Cancel the pending auto-loop / heartbeat callback, if any."""
+        loop_id = getattr(self, "_auto_loop_id", None)
+        if loop_id is not None:
+            # Cleared first: the id is never cancelled twice
+            self._auto_loop_id = None
+            self.root.after_cancel(loop_id)
 
     def _phase_from_wallclock_patched(self):
+        # The phase only changes at four wall-clock hours a day: reuse the
+        # cached phase until the next boundary instead of building a
+        # datetime on every heartbeat
+        cache = self._phase_cache
+        now = time.time()
+        if now < cache["until_ts"]:
+            return cache["phase"]
         try:
-            now = dt.datetime.now()
-            h = now.hour
-            if 6 <= h < 12: return "morning"
-            if 12 <= h < 15: return "noon"
-            if 15 <= h < 19: return "afternoon"
-            return "evening"
+            lt = time.localtime(now)
+            idx = bisect.bisect_right(_PHASE_HOURS, lt.tm_hour)
+            if idx < len(_PHASE_HOURS):
+                y, mo, d, nh = lt.tm_year, lt.tm_mon, lt.tm_mday, _PHASE_HOURS[idx]
+            else:
+                # After the last boundary: next change is tomorrow morning
+                # (mktime normalises the day overflow)
+                y, mo, d, nh = lt.tm_year, lt.tm_mon, lt.tm_mday + 1, _PHASE_HOURS[0]
+            cache["phase"] = _PHASE_NAMES[idx]
+            cache["until_ts"] = time.mktime((y, mo, d, nh, 0, 0, 0, 0, -1))
+            return cache["phase"]
         except Exception:
             return getattr(self.garden, "phase", "morning")
 
     def _enable_real_time_patched(self, enabled: bool):
+        self.real_time_mode = bool(enabled)
         try:
-            self.real_time_mode = bool(enabled)
-        except Exception:
-            self.real_time_mode = False
-        try:
-            if getattr(self, "_auto_loop_id", None) is not None:
-                try: self.root.after_cancel(self._auto_loop_id)
-                except Exception: pass
-                self._auto_loop_id = None
+            self._cancel_auto_loop()
+            if self.real_time_mode:
+                self._real_time_heartbeat_patched()
+            elif getattr(self, "running", True):
+                self._ensure_auto_loop(delay_ms=max(50, getattr(self, 'phase_ms', 600)))
         except Exception:
             pass
-        if self.real_time_mode:
-            try:
-                self._real_time_heartbeat()
-            except Exception:
-                pass
-        else:
-            try:
-                if getattr(self, "running", True):
-                    self._ensure_auto_loop(delay_ms=max(50, getattr(self, 'phase_ms', 600)))
-            except Exception:
-                pass
 
     def _real_time_heartbeat_patched(self):
+        # Catch up to the wall-clock phase one step per idle tick (see
+        # _advance_one_phase_step) so UI events interleave with the advances
         try:
-            target = self._phase_from_wallclock()
-            cur = getattr(self.garden, "phase", None)
-            max_steps = 4
-            while cur != target and max_steps > 0:
-                try:
-                    self.garden.next_phase()
-                except Exception:
-                    break
-                max_steps -= 1
-                cur = getattr(self.garden, "phase", None)
-            try: self.render_all()
-            except Exception: pass
+            target = self._phase_from_wallclock_patched()
+            self.root.after_idle(self._advance_one_phase_step, target, 4)
         except Exception:
             pass
         try:
             if getattr(self, "real_time_mode", False):
-                self._auto_loop_id = self.root.after(30000, self._real_time_heartbeat)
+                self._auto_loop_id = self.root.after(30000, self._real_time_heartbeat_patched)
+        except Exception:
+            pass
+
+    def _advance_one_phase_step(self, target, max_steps):
+        """Advance one phase toward target, re-queueing itself until reached."""
+        try:
+            cur = getattr(self.garden, "phase", None)
+            if (cur != target and max_steps > 0
+                    and getattr(self, "real_time_mode", False)):
+                self.garden.next_phase()
+                self._season_poll()
+                self.root.after_idle(self._advance_one_phase_step, target, max_steps - 1)
+                return
         except Exception:
             pass
+        # Reached (or gave up on) the target: one redraw for the whole catch-up
+        try: self.render_all()
+        except Exception: pass
 
     def _recalc_timers(self):
         """Compute per-phase sub-update and phase delays (ms)
@@ -8578,87 +8768,140 @@ class GardenApp:
             per_hour = 1.0
 
         # Keep the old proportions: 3 temperature sub-updates vs one phase wait
-        # (1050 ms vs 600 ms at the old reference speed)
-        sub_ratio_total = 1050.0
-        phase_ratio = 600.0
-        total = sub_ratio_total + phase_ratio  # 1650
-
-        # Total wall time for one simulated hour ≈ per_hour seconds
-        sub_total = per_hour * (sub_ratio_total / total)  # seconds across 3 substeps
-
-        # Milliseconds per substep / phase
-        self.sub_ms = max(50, int((sub_total / 3.0) * 1000))                 # ms per substep
-        self.phase_ms = max(50, int((per_hour * (phase_ratio / total)) * 1000))  # ms after phase advance
+        self.sub_ms = max(50, int(per_hour * _SUB_FRAC))      # ms per substep
+        self.phase_ms = max(50, int(per_hour * _PHASE_FRAC))  # ms after phase advance
 
     def archive_snapshot(self, plant, **extras):
         """
         Upsert a single plant snapshot into app.archive['plants'].
         Extras (e.g., source_pod_index=...) will be merged in.
         """
+        return self.archive_snapshot_many((plant,), **extras) > 0
+
+    @staticmethod
+    def _archive_fingerprint(plant, extras):
+        """
+        Cheap change check for a live plant's archive snapshot.
+
+        Scalars by value; traits, genotype and lineage lists by identity and
+        length (they are replaced or appended to, not edited in place).
+
+        Returns:
+            (fingerprint tuple, the containers it identifies) — the caller
+            keeps the containers so their ids cannot be reused
+        """
+        traits = getattr(plant, "traits", None)
+        anc = getattr(plant, "ancestry", None)
+        pat = getattr(plant, "paternal_ancestry", None)
+        geno = getattr(plant, "genotype", None)
+        return (
+            getattr(plant, "generation", None), getattr(plant, "gen", None),
+            getattr(plant, "mother_id", None), getattr(plant, "father_id", None),
+            id(traits), len(traits) if traits else 0,
+            id(anc), len(anc) if anc else 0,
+            id(pat), len(pat) if pat else 0,
+            id(geno), getattr(plant, "source_pod_index", None),
+            tuple(extras.items()) if extras else (),
+        ), (traits, anc, pat, geno)
+
+    def archive_snapshot_many(self, plants_iter, **extras):
+        """
+        Upsert snapshots for several plants into app.archive['plants'].
+
+        Same per-plant result as archive_snapshot(), with the archive lookup
+        and the live-plant index for minimal dict records done once per call.
+        Extras are merged into every snapshot.
+
+        Returns:
+            Number of snapshots stored
+        """
         try:
             if not hasattr(self, "archive"):
                 self.archive = {}
+                self._archive_fp.clear()
             plants = self.archive.setdefault("plants", {})
-            def g(o, k, d=None):
-                return o.get(k, d) if isinstance(o, dict) else getattr(o, k, d)
-            pid = g(plant, "id", None)
-            if pid is None:
-                return False
-            # If plant is a minimal dict (no traits), try to find the live plant
-            # on a tile and use it instead — this gives TIE nodes their trait icons.
-            if isinstance(plant, dict) and not plant.get("traits"):
-                live = next(
-                    (t.plant for t in getattr(self, 'tiles', [])
-                     if t.plant is not None
-                     and str(getattr(t.plant, 'id', '')) == str(pid)),
-                    None)
-                if live is not None:
-                    plant = live
-            snap = {
-                "id": pid,
-                "generation": g(plant, "generation", g(plant, "gen", "F?")),
-                "mother_id": g(plant, "mother_id", g(plant, "motherId", None)),
-                "father_id": g(plant, "father_id", g(plant, "fatherId", None)),
-                "traits": g(plant, "traits", {}) or {},
-                # Lineage helpers used by the Trait Inheritance Explorer
-                "ancestry": list(g(plant, "ancestry", []) or []),
-                "paternal_ancestry": list(g(plant, "paternal_ancestry", []) or []),
-            }
+        except Exception:
+            return 0
 
-            # Safety: ensure F0 lineage is never blank in archive-only views
+        g = _g
+        fps = self._archive_fp
+        live_by_id = None  # str(id) -> plant on a tile, built on first need
+        count = 0
+        for plant in plants_iter:
             try:
-                if str(snap.get("generation", "")).upper() == "F0":
-                    if not snap.get("ancestry"):
+                pid = g(plant, "id", None)
+                if pid is None:
+                    continue
+                pid_s = str(pid)
+                fp = None
+                if type(plant) is not dict:
+                    # Unchanged live plant whose stored entry is still the one
+                    # written last time: the merge below would reproduce it
+                    fp, refs = self._archive_fingerprint(plant, extras)
+                    prev = fps.get(pid_s)
+                    if prev is not None and prev[0] is plants.get(pid_s) and prev[1] == fp:
+                        count += 1
+                        continue
+                # If plant is a minimal dict (no traits), try to find the live plant
+                # on a tile and use it instead — this gives TIE nodes their trait icons.
+                if isinstance(plant, dict) and not plant.get("traits"):
+                    if live_by_id is None:
+                        live_by_id = {}
+                        for t in getattr(self, 'tiles', []):
+                            if t.plant is not None:
+                                live_by_id.setdefault(str(getattr(t.plant, 'id', '')), t.plant)
+                    plant = live_by_id.get(pid_s, plant)
+                snap = {
+                    "id": pid,
+                    "generation": g(plant, "generation", g(plant, "gen", "F?")),
+                    "mother_id": g(plant, "mother_id", g(plant, "motherId", None)),
+                    "father_id": g(plant, "father_id", g(plant, "fatherId", None)),
+                    "traits": g(plant, "traits", {}) or {},
+                    # Lineage helpers used by the Trait Inheritance Explorer
+                    "ancestry": _list_or_empty(g(plant, "ancestry")),
+                    "paternal_ancestry": _list_or_empty(g(plant, "paternal_ancestry")),
+                }
+
+                # Safety: ensure F0 lineage is never blank in archive-only views
+                if str(snap["generation"]).upper() == "F0":
+                    if not snap["ancestry"]:
                         snap["ancestry"] = [pid]
-                    if not snap.get("paternal_ancestry"):
+                    if not snap["paternal_ancestry"]:
                         snap["paternal_ancestry"] = [pid]
+                geno = g(plant, "genotype", None)
+                if geno:
+                    snap["genotype"] = geno
+                # Also carry source_pod_index from the live plant if present
+                spidx = g(plant, "source_pod_index", None)
+                if spidx is not None:
+                    snap["source_pod_index"] = spidx
+                if extras:
+                    snap.update(extras)
+                # Merge with existing archive entry — preserve any fields the new snap
+                # doesn't have (e.g. source_pod_index set before a save/load cycle).
+                existing = plants.get(pid_s)
+                if isinstance(existing, dict):
+                    merged = dict(existing)
+                    merged.update(snap)
+                    # Never overwrite rich traits/genotype with empty ones —
+                    # a minimal snapshot (e.g. from _ensure_min) must not blank out
+                    # a previously stored full entry.
+                    for field in ("traits", "genotype", "ancestry", "paternal_ancestry"):
+                        if not snap.get(field) and existing.get(field):
+                            merged[field] = existing[field]
+                    snap = merged
+                plants[pid_s] = snap   # always string key — consistent with seed_archive_from_live
+                if fp is not None:
+                    if getattr(plant, "alive", True):
+                        fps[pid_s] = (snap, fp, refs)
+                    else:
+                        # Dead plants are not re-snapshotted every tick; don't
+                        # keep their containers alive for a skip check
+                        fps.pop(pid_s, None)
+                count += 1
             except Exception:
                 pass
-            geno = g(plant, "genotype", None)
-            if geno:
-                snap["genotype"] = geno
-            # Also carry source_pod_index from the live plant if present
-            spidx = g(plant, "source_pod_index", None)
-            if spidx is not None:
-                snap["source_pod_index"] = spidx
-            snap.update(extras or {})
-            # Merge with existing archive entry — preserve any fields the new snap
-            # doesn't have (e.g. source_pod_index set before a save/load cycle).
-            existing = plants.get(str(pid))
-            if isinstance(existing, dict):
-                merged = dict(existing)
-                merged.update(snap)
-                # Never overwrite rich traits/genotype with empty ones —
-                # a minimal snapshot (e.g. from _ensure_min) must not blank out
-                # a previously stored full entry.
-                for field in ("traits", "genotype", "ancestry", "paternal_ancestry"):
-                    if not snap.get(field) and existing.get(field):
-                        merged[field] = existing[field]
-                snap = merged
-            plants[str(pid)] = snap   # always string key — consistent with seed_archive_from_live
-            return True
-        except Exception:
-            return False
+        return count
 
 
 
@@ -8670,10 +8913,24 @@ def _grid_config_path():
     return os.path.join(base, "mendel_garden_config.json")
 
 
+# Last parsed grid config: {'key': (path, mtime_ns), 'val': result}
+_GRID_CFG_CACHE = {}
+
+
+def _invalidate_grid_config_cache():
+    _GRID_CFG_CACHE.clear()
+
+
 def _load_grid_config():
     path = _grid_config_path()
-    if not os.path.exists(path):
+    try:
+        key = (path, os.stat(path).st_mtime_ns)
+    except OSError:
+        # Missing or unreadable file → no config
         return None
+    if _GRID_CFG_CACHE.get('key') == key:
+        val = _GRID_CFG_CACHE['val']
+        return dict(val) if val is not None else None
     try:
         with open(path, "r", encoding="utf-8") as f:
             cfg = json.load(f)
@@ -8682,10 +8939,13 @@ def _load_grid_config():
         if rows <= 0 or cols <= 0:
             raise ValueError
         show_dialog = bool(cfg.get("show_dialog", True))
-        return {"rows": rows, "cols": cols, "show_dialog": show_dialog}
+        result = {"rows": rows, "cols": cols, "show_dialog": show_dialog}
     except Exception:
         # Broken config → ignore & use defaults
-        return None
+        result = None
+    _GRID_CFG_CACHE['key'] = key
+    _GRID_CFG_CACHE['val'] = result
+    return dict(result) if result is not None else None
 
 
 def _save_grid_config(rows, cols, show_dialog):
@@ -8697,6 +8957,20 @@ def _save_grid_config(rows, cols, show_dialog):
     except Exception:
         # Failing to save config should never kill the app
         pass
+    finally:
+        _invalidate_grid_config_cache()
+
+
+def _remove_grid_config():
+    path = _grid_config_path()
+    try:
+        if os.path.exists(path):
+            os.remove(path)
+    except Exception:
+        pass
+    finally:
+        _invalidate_grid_config_cache()
+
 
 def _apply_grid_size(rows, cols):
     """Update global grid constants so the rest of the sim picks them up."""
@@ -8706,6 +8980,27 @@ def _apply_grid_size(rows, cols):
     GRID_SIZE = ROWS * COLS
     TILES_PER_ROW = COLS
 
+# Garden size dialog presets: (label, cols, rows), grouped by screen class
+_GRID_PRESETS = (
+    # 4K Ultra HD (3840×2160)
+    ("32 × 14   (4K Ultra HD ≥ 3840×2160)", 32, 14),
+    ("28 × 12   (4K compact)",              28, 12),
+    # 1440p (2560×1440)
+    ("24 × 10   (QHD ≥ 2560×1440)",         24, 10),
+    ("20 × 9    (QHD compact)",             20, 9),
+    # 1080p / Full HD (1920×1080)
+    ("18 × 8    (Full HD max)",             18, 8),
+    ("17 × 8    (Full HD Lenovo X1)",       17, 8),
+    ("16 × 7    (Full HD standard)",        16, 7),
+    # 900p (1600×900)
+    ("14 × 7    (1600×900)",                14, 7),
+    # HD+ / HD
+    ("10 × 5    (HD+ ≥ 1366×768)",          10, 5),
+    ("8 × 3     (HD ≥ 1280×720)",           8, 3),
+)
+_GRID_PRESET_DEFAULT = 6  # "16 × 7 (Full HD standard)"
+
+
 def _ask_grid_size(root, existing_config=None):
     """Small popup to choose grid size (rows x cols) with recommended resolutions."""
 
@@ -8736,39 +9031,20 @@ def _ask_grid_size(root, existing_config=None):
     # Preset combo
     tk.Label(main, text="Preset:", font=("Segoe UI", 11, "bold")).grid(row=0, column=0, sticky="w", pady=(0,4))
 
-    presets = {
-        # 4K Ultra HD (3840×2160)
-        "32 × 14   (4K Ultra HD ≥ 3840×2160)":     (32, 14),
-        "28 × 12   (4K compact)":                  (28, 12),
-
-        # 1440p (2560×1440)
-        "24 × 10   (QHD ≥ 2560×1440)":             (24, 10),
-        "20 × 9    (QHD compact)":                 (20, 9),
-
-        # 1080p / Full HD (1920×1080)
-        "18 × 8    (Full HD max)":                 (18, 8),
-        "17 × 8    (Full HD Lenovo X1)":           (17, 8),
-        "16 × 7    (Full HD standard)":            (16, 7),   # ← **comma was missing here**
-
-        # 900p (1600×900)
-        "14 × 7    (1600×900)":                    (14, 7),
+    preset_names = [name for name, _, _ in _GRID_PRESETS]
 
-        # HD+ / HD
-        "10 × 5    (HD+ ≥ 1366×768)":              (10, 5),
-        "8 × 3     (HD ≥ 1280×720)":               (8, 3),
-    }
-
-    preset_names = list(presets.keys())
-
-    # Default to the Full HD standard preset (string must match key exactly)
-    preset_var = tk.StringVar(value="16 × 7    (Full HD standard)")
+    # Default to the Full HD standard preset
+    preset_var = tk.StringVar(value=preset_names[_GRID_PRESET_DEFAULT])
 
     cols_var = tk.StringVar(value=str(cols))
     rows_var = tk.StringVar(value=str(rows))
 
     def on_preset(*_):
-        # Interpret preset as (cols, rows)
-        c, r = presets[preset_var.get()]
+        # Interpret preset as (cols, rows); the combobox index is the tuple index
+        idx = combo.current()
+        if idx < 0:
+            return
+        _, c, r = _GRID_PRESETS[idx]
         cols_var.set(str(c))
         rows_var.set(str(r))
 
@@ -8873,12 +9149,7 @@ def main():
                 _save_grid_config(rows, cols, show_dialog_next)
             else:
                 # If user wants dialog next time, remove old config if it exists
-                path = _grid_config_path()
-                if os.path.exists(path):
-                    try:
-                        os.remove(path)
-                    except Exception:
-                        pass
+                _remove_grid_config()
 
         except Exception:
             # If dialog fails, just run with whatever global defaults are
@@ -7,8 +7,117 @@ on individual anthers that need to be removed from the flower.
 
 import tkinter as tk
 from tkinter import Canvas
-from PIL import Image, ImageTk
+from PIL import Image, ImageDraw, ImageTk
 import math
+import random
+
+
+# Resized icons keyed by (path, scale, size), as PIL images. PhotoImages
+# are bound to a Tk interpreter; the app runs a single one, so the cursor and
+# anther PhotoImages are shared at class level (_CURSOR_PHOTO,
+# _ANTHER_PHOTOS) and only the flower PhotoImage is built per dialog.
+_image_cache = {}
+
+# Removed-anther fade: (fill, outline) per 80 ms frame; deleted after the last
+FADE_COLORS = (
+    ("#ff4444", "#cc0000"),  # Flash red briefly
+    ("#888888", "#666666"),  # Fade to gray
+    ("#444444", "#333333"),  # Final fade
+)
+FADE_FRAME_MS = 80
+
+# Anther geometry in original image pixels: the 5 reference anthers
+# (jittered per dialog, each gets a second anther nearby) and the point
+# all stalks start from
+BASE_ANTHERS = (
+    (437, 387),      # Anther 0
+    (494.5, 395.5),  # Anther 1
+    (510.5, 462.5),  # Anther 2
+    (457.5, 447.5),  # Anther 3
+    (420.5, 486.5),  # Anther 4
+)
+STALK_CENTER = (334, 417)
+# Points per stalk curve (matches Tk's splinesteps for smooth lines)
+STALK_STEPS = 20
+# Quadratic Bezier basis weights (u^2, 2ut, t^2) at t = i / STALK_STEPS
+_STALK_WEIGHTS = tuple(
+    ((1 - i / STALK_STEPS) ** 2,
+     2 * (1 - i / STALK_STEPS) * (i / STALK_STEPS),
+     (i / STALK_STEPS) ** 2)
+    for i in range(STALK_STEPS + 1)
+)
+
+# Anther sprite colours: body fill, pollen dot, outline normal / hovered
+ANTHER_FILL = "#f4d03f"  # Bright yellow
+POLLEN_FILL = "#ffeb3b"
+ANTHER_OUTLINE = "#ff8c00"  # ORANGE outline
+ANTHER_HOVER_OUTLINE = "#ff6600"
+# Sprites are drawn this many times larger, then downsampled (anti-aliasing)
+SPRITE_SUPERSAMPLE = 4
+
+
+def _quad_bezier(x0, y0, cx, cy, x1, y1):
+    """
+    Flattened points of a quadratic Bezier curve, for a plain create_line.
+
+    Gives the same points Tk computes for a smooth 3-point line with
+    splinesteps=STALK_STEPS, but once instead of on every redraw.
+
+    Returns:
+        [x0, y0, ..., x1, y1] with STALK_STEPS + 1 points
+    """
+    pts = [0.0] * (2 * len(_STALK_WEIGHTS))
+    pts[0::2] = [a * x0 + b * cx + c * x1 for a, b, c in _STALK_WEIGHTS]
+    pts[1::2] = [a * y0 + b * cy + c * y1 for a, b, c in _STALK_WEIGHTS]
+    return pts
+
+
+def _parse_geometry(geom):
+    """
+    Split a Tk geometry string such as "800x600+10+20".
+
+    Returns:
+        (x, y, width, height)
+    """
+    size, x, y = geom.replace("+-", "-").replace("-", "+-").split("+")
+    w, h = size.split("x")
+    return int(x), int(y), int(w), int(h)
+
+
+def _load_resized(path, scale=None, size=None):
+    """
+    Open an icon and LANCZOS-resize it, reusing the result across dialogs.
+
+    Args:
+        path: Image file path
+        scale: Factor applied to the original dimensions, or
+        size: Fixed (width, height) to resize to
+
+    Returns:
+        (original_width, original_height, resized PIL Image)
+    """
+    key = (path, scale, size)
+    hit = _image_cache.get(key)
+    if hit is None:
+        with Image.open(path) as img:
+            if size is None:
+                size = (int(img.width * scale), int(img.height * scale))
+            hit = (img.width, img.height, img.resize(size, Image.Resampling.LANCZOS))
+        _image_cache[key] = hit
+    return hit
+
+
+class _Anther:
+    """One clickable anther: canvas item ids, centre and removal state."""
+    __slots__ = ('id', 'body', 'stalk', 'x', 'y', 'removed')
+
+    def __init__(self, id, body, stalk, x, y):
+        self.id = id
+        self.body = body  # Sprite image item
+        self.stalk = stalk  # Polyline item
+        self.x = x
+        self.y = y
+        self.removed = False
 
 
 class EmasculationDialog(tk.Toplevel):
@@ -19,6 +128,13 @@ class EmasculationDialog(tk.Toplevel):
     Only when all 5 anthers are removed does the emasculation complete.
     """
     
+    # Tweezer cursor PhotoImage, created by the first dialog and shared by
+    # all later ones (the class reference keeps Tk from freeing it)
+    _CURSOR_PHOTO = None
+    # Anther sprite PhotoImages keyed by (size, pollen size, fill, outline,
+    # outline width); shared the same way
+    _ANTHER_PHOTOS = {}
+    
     def __init__(self, parent, flower_color="purple", callback=None):
         """
         Initialize the emasculation dialog.
@@ -36,6 +152,17 @@ class EmasculationDialog(tk.Toplevel):
         self.total_anthers = 10  # Changed from 5 to 10
         self.completed = False
         
+        # Hover state: latest pointer position awaiting processing, its idle
+        # job, ids of highlighted anthers and whether the tweezer is shown
+        self._motion_pos = None
+        self._motion_job = None
+        self._hovered = set()
+        self._hover_cursor = None
+        
+        # Anthers being faded out as [anther, stage], all driven by one timer
+        self._fade_queue = []
+        self._fade_job = None
+        
         # Select correct flower image based on color (from icons folder)
         if flower_color == "white":
             self.flower_image_path = "icons/flower_white_emasculated.png"
@@ -64,8 +191,10 @@ class EmasculationDialog(tk.Toplevel):
         # Calculate offset based on canvas size (which is now scaled)
         x_offset = max(250, self.canvas_width // 2 + 100)
         y_offset = max(250, self.canvas_height // 2 + 100)
-        x = parent.winfo_x() + (parent.winfo_width() // 2) - x_offset
-        y = parent.winfo_y() + (parent.winfo_height() // 2) - y_offset
+        # Parent's "WxH+X+Y" in one Tk call instead of four winfo_* queries
+        px, py, pw, ph = _parse_geometry(parent.winfo_geometry())
+        x = px + (pw // 2) - x_offset
+        y = py + (ph // 2) - y_offset
         self.geometry(f"+{x}+{y}")
         
         # Close button handler
@@ -101,18 +230,10 @@ class EmasculationDialog(tk.Toplevel):
         
         # Load flower image
         try:
-            img = Image.open(self.flower_image_path)
-            
-            # Store original dimensions for coordinate scaling
-            self.original_width = img.width
-            self.original_height = img.height
-            
-            # Apply display scaling factor to make dialog smaller
-            display_width = int(img.width * self.display_scale)
-            display_height = int(img.height * self.display_scale)
-            
-            # Resize image
-            img = img.resize((display_width, display_height), Image.Resampling.LANCZOS)
+            # Resized once per (image, scale); later dialogs reuse it
+            self.original_width, self.original_height, img = _load_resized(
+                self.flower_image_path, scale=self.display_scale)
+            display_width, display_height = img.width, img.height
             print(f"Scaled from {self.original_width}x{self.original_height} to {display_width}x{display_height} (factor: {self.display_scale})")
             
             # Scale factor for coordinates
@@ -143,15 +264,17 @@ class EmasculationDialog(tk.Toplevel):
         
         # Load custom tweezer cursor
         try:
-            cursor_img = Image.open(self.tweezer_cursor_path)
             # Keep cursor at constant size (24x24) regardless of display scale
             cursor_size = 24
-            cursor_img = cursor_img.resize((cursor_size, cursor_size), Image.Resampling.LANCZOS)
-            # Create cursor string for tkinter
-            # Note: Tkinter expects specific cursor format, we'll use the image as PhotoImage
-            self.tweezer_cursor = ImageTk.PhotoImage(cursor_img)
+            cls = type(self)
+            if cls._CURSOR_PHOTO is None:
+                _, _, cursor_img = _load_resized(
+                    self.tweezer_cursor_path, size=(cursor_size, cursor_size))
+                # Note: Tkinter expects specific cursor format, we'll use the image as PhotoImage
+                cls._CURSOR_PHOTO = ImageTk.PhotoImage(cursor_img)
+                print(f"Loaded custom tweezer cursor at {cursor_size}x{cursor_size} (constant size)")
+            self.tweezer_cursor = cls._CURSOR_PHOTO
             self.has_custom_cursor = True
-            print(f"Loaded custom tweezer cursor at {cursor_size}x{cursor_size} (constant size)")
         except Exception as e:
             print(f"Could not load custom cursor: {e}, using hand2 instead")
             self.has_custom_cursor = False
@@ -187,8 +310,10 @@ class EmasculationDialog(tk.Toplevel):
         # Set default cursor
         self.canvas.config(cursor="crosshair")
         
-        # Success message frame (pre-allocated, initially empty)
-        self.success_frame = tk.Frame(self, bg="#e8f5e9", height=0)
+        # Success message (pre-allocated and laid out now, blank and in the
+        # window's own background; completion only changes text and colour,
+        # so the dialog is not re-laid out)
+        self.success_frame = tk.Frame(self, height=0)
         self.success_frame.pack(fill="x", padx=10, pady=(5, 0))
         
         self.success_label = tk.Label(
@@ -196,10 +321,9 @@ class EmasculationDialog(tk.Toplevel):
             text="",
             font=("Segoe UI", 10),
             fg="#2e7d32",
-            bg="#e8f5e9",
             pady=5
         )
-        # Don't pack yet - will pack when needed
+        self.success_label.pack(fill="x")
         
         # Button frame
         button_frame = tk.Frame(self)
@@ -214,62 +338,99 @@ class EmasculationDialog(tk.Toplevel):
         )
         self.cancel_btn.pack(side="right", padx=5)
     
+    def _anther_sprite(self, fill, outline, width):
+        """
+        Anther body, outline and pollen dot pre-rendered as one PhotoImage.
+
+        Every variant has the same size (room for the widest outline), so
+        swapping the image of a canvas item keeps it centred.
+        """
+        w, h, pollen, max_width = self._sprite_dims
+        key = (w, h, pollen, fill, outline, width)
+        photo = self._ANTHER_PHOTOS.get(key)
+        if photo is None:
+            k = SPRITE_SUPERSAMPLE
+            size = (w + max_width, h + max_width)
+            img = Image.new("RGBA", (size[0] * k, size[1] * k), (0, 0, 0, 0))
+            draw = ImageDraw.Draw(img)
+            # Tk centres an oval's outline on its bbox; PIL draws it inside
+            inset = (max_width - width) * k // 2
+            draw.ellipse(
+                (inset, inset, size[0] * k - 1 - inset, size[1] * k - 1 - inset),
+                fill=fill, outline=outline, width=width * k,
+            )
+            cx, cy, r = size[0] * k // 2, size[1] * k // 2, pollen * k
+            draw.ellipse((cx - r, cy - r, cx + r, cy + r), fill=POLLEN_FILL)
+            img = img.resize(size, Image.Resampling.LANCZOS)
+            photo = self._ANTHER_PHOTOS[key] = ImageTk.PhotoImage(img)
+        return photo
+    
     def _create_anthers(self):
         """Create the 10 anthers using precise coordinates with slight randomization."""
         self.anthers = []
         
+        sf = self.scale_factor
+        uniform, cos, sin = random.uniform, math.cos, math.sin
+        
         # Original 5 anther coordinates from the reference image (original size)
-        # Add slight jitter (±2-3 pixels) to make each flower unique
-        import random
-        
-        base_anther_coords = [
-            (437, 387),      # Anther 0
-            (494.5, 395.5),  # Anther 1
-            (510.5, 462.5),  # Anther 2
-            (457.5, 447.5),  # Anther 3
-            (420.5, 486.5),  # Anther 4
+        # with slight jitter (±2-3 pixels) to make each flower unique
+        original_anther_coords = [
+            (x + uniform(-3, 3), y + uniform(-3, 3)) for x, y in BASE_ANTHERS
         ]
         
-        # Apply slight random jitter to base positions (2-3 pixels)
-        original_anther_coords = []
-        for x, y in base_anther_coords:
-            jitter_x = random.uniform(-3, 3)
-            jitter_y = random.uniform(-3, 3)
-            original_anther_coords.append((x + jitter_x, y + jitter_y))
-        
         # Add 5 more anthers near the originals with random offsets
         additional_anthers = []
         for x, y in original_anther_coords:
             # Random offset: 10-25 pixels in random direction
-            offset_distance = random.uniform(10, 25)
-            offset_angle = random.uniform(0, 2 * math.pi)
+            offset_distance = uniform(10, 25)
+            offset_angle = uniform(0, 2 * math.pi)
             # Add slight jitter to the offset too
-            jitter_x = random.uniform(-2, 2)
-            jitter_y = random.uniform(-2, 2)
-            new_x = x + offset_distance * math.cos(offset_angle) + jitter_x
-            new_y = y + offset_distance * math.sin(offset_angle) + jitter_y
-            additional_anthers.append((new_x, new_y))
-        
-        # Combine all 10 anthers
-        all_anther_coords = original_anther_coords + additional_anthers
-        
-        # Scale coordinates if image was resized
+            jitter_x = uniform(-2, 2)
+            jitter_y = uniform(-2, 2)
+            additional_anthers.append((
+                x + offset_distance * cos(offset_angle) + jitter_x,
+                y + offset_distance * sin(offset_angle) + jitter_y,
+            ))
+        
+        # Combine all 10 anthers, scaled if the image was resized
         scaled_coords = [
-            (x * self.scale_factor, y * self.scale_factor) 
-            for x, y in all_anther_coords
+            (x * sf, y * sf) for x, y in original_anther_coords + additional_anthers
         ]
         
-        # Center point for stalks (specified coordinates)
-        center_x = 334 * self.scale_factor
-        center_y = 417 * self.scale_factor
+        # Center point for stalks
+        center_x = STALK_CENTER[0] * sf
+        center_y = STALK_CENTER[1] * sf
         
-        # Anther dimensions
-        anther_width = int(32 * self.scale_factor)
-        anther_height = int(24 * self.scale_factor)
-        click_tolerance = int(25 * self.scale_factor)
+        # Anther dimensions (same for every anther; computed once)
+        anther_width = int(32 * sf)
+        anther_height = int(24 * sf)
+        click_tolerance = int(25 * sf)
+        pollen_size = max(3, int(4 * sf))
+        # Stalks: (width, curve factor) — additional anthers are thinner and
+        # shorter (control point closer to the anther: 10% instead of 15%)
+        stalk_main = (max(6, int(8 * sf)), 0.15)
+        stalk_additional = (max(4, int(6 * sf)), 0.10)
         
         # Store scaled tolerance for click detection
         self.click_tolerance = click_tolerance
+        self._tol2 = click_tolerance * click_tolerance
+        # Anther outline widths: normal / hovered
+        self._outline_width = max(4, int(5 * sf))
+        self._hover_width = max(5, int(6 * sf))
+        
+        # One pre-rendered sprite per anther look: normal, hovered, and each
+        # removal fade frame (one canvas image item per anther instead of
+        # two ovals redrawn by Tk)
+        self._sprite_dims = (anther_width, anther_height, pollen_size,
+                             self._hover_width)
+        self._sprite_normal = self._anther_sprite(
+            ANTHER_FILL, ANTHER_OUTLINE, self._outline_width)
+        self._sprite_hover = self._anther_sprite(
+            ANTHER_FILL, ANTHER_HOVER_OUTLINE, self._hover_width)
+        self._sprite_fade = tuple(
+            self._anther_sprite(fill, outline, self._outline_width)
+            for fill, outline in FADE_COLORS
+        )
         self.total_anthers = 10  # Update total count
         
         print(f"Creating 10 anthers with center at: ({center_x:.1f}, {center_y:.1f})")
@@ -279,78 +440,39 @@ class EmasculationDialog(tk.Toplevel):
             is_additional = i >= 5  # Anthers 5-9 are the additional ones
             print(f"Creating anther {i} at ({x:.1f}, {y:.1f}) {'(shorter)' if is_additional else ''}")
             
-            # Calculate control point for curve
+            stalk_width, curve = stalk_additional if is_additional else stalk_main
+            
+            # Control point for smooth curve, offset perpendicular to the stalk
             dx = x - center_x
             dy = y - center_y
+            ctrl_x = (center_x + x) / 2 - dy * curve
+            ctrl_y = (center_y + y) / 2 + dx * curve
             
-            # Additional anthers have shorter stalks (less curve distance)
-            if is_additional:
-                # Shorter stalk - control point closer to anther
-                perp_x = -dy * 0.10  # Less curve (10% instead of 15%)
-                perp_y = dx * 0.10
-            else:
-                # Original length
-                perp_x = -dy * 0.15
-                perp_y = dx * 0.15
-            
-            # Control point for smooth curve
-            ctrl_x = (center_x + x) / 2 + perp_x
-            ctrl_y = (center_y + y) / 2 + perp_y
-            
-            # Create curved line - thinner for additional anthers
-            if is_additional:
-                stalk_width = max(4, int(6 * self.scale_factor))  # Thinner
-            else:
-                stalk_width = max(6, int(8 * self.scale_factor))  # Original thickness
-            
+            # Curve precomputed as a polyline (Tk would re-evaluate a
+            # smooth line's spline on every redraw)
             stalk = self.canvas.create_line(
-                center_x, center_y, 
-                ctrl_x, ctrl_y,
-                x, y,
+                *_quad_bezier(center_x, center_y, ctrl_x, ctrl_y, x, y),
                 fill="#000000",  # BLACK
                 width=stalk_width,
-                smooth=True,
-                splinesteps=20,
-                capstyle="round"
+                capstyle="round",
+                joinstyle="round"
             )
             
-            # Create anther body (yellow oval) - with ORANGE outline
-            anther = self.canvas.create_oval(
-                x - anther_width // 2,
-                y - anther_height // 2,
-                x + anther_width // 2,
-                y + anther_height // 2,
-                fill="#f4d03f",  # Bright yellow
-                outline="#ff8c00",  # ORANGE outline
-                width=max(4, int(5 * self.scale_factor)),  # THICK orange outline
+            # Anther body (yellow oval, thick orange outline, pollen dot)
+            anther = self.canvas.create_image(
+                x, y,
+                image=self._sprite_normal,
                 tags=f"anther_{i}"
             )
-            
-            # Bring anther to front
-            self.canvas.tag_raise(anther)
-            
-            # Add pollen dot in center
-            pollen_size = max(3, int(4 * self.scale_factor))
-            pollen = self.canvas.create_oval(
-                x - pollen_size, y - pollen_size,
-                x + pollen_size, y + pollen_size,
-                fill="#ffeb3b",
-                outline="",
-                tags=f"anther_{i}_pollen"
-            )
-            self.canvas.tag_raise(pollen)
+            # (New canvas items are created on top: the body needs no
+            # tag_raise; only the cursor icon is raised once below)
             
             # Store anther data
-            self.anthers.append({
-                "id": i,
-                "body": anther,
-                "stalk": stalk,
-                "x": x,
-                "y": y,
-                "removed": False
-            })
+            self.anthers.append(_Anther(i, anther, stalk, x, y))
             
         print(f"Created {len(self.anthers)} anthers (5 original + 5 additional)")
+        # Anthers not yet removed; hit tests only walk these
+        self._active_anthers = list(self.anthers)
         
         # Ensure cursor icon is always on top
         if self.has_custom_cursor and self.cursor_icon:
@@ -360,94 +482,100 @@ class EmasculationDialog(tk.Toplevel):
         """Handle mouse movement to show hover effects."""
         if self.completed:
             return
-        
-        # Check if hovering over an anther
-        hovering = False
-        for anther in self.anthers:
-            if anther["removed"]:
-                continue
-            
-            dx = event.x - anther["x"]
-            dy = event.y - anther["y"]
-            distance = math.sqrt(dx * dx + dy * dy)
-            
-            if distance < self.click_tolerance:  # Use scaled tolerance
-                hovering = True
-                # Highlight the anther with thicker bright orange outline
-                self.canvas.itemconfig(anther["body"], outline="#ff6600", width=max(5, int(6 * self.scale_factor)))
-            else:
-                # Reset to normal orange outline
-                outline_width = max(4, int(5 * self.scale_factor))
-                self.canvas.itemconfig(anther["body"], outline="#ff8c00", width=outline_width)
+        # Coalesce motion events: only the latest position is processed,
+        # once per idle pass
+        self._motion_pos = (event.x, event.y)
+        if self._motion_job is None:
+            self._motion_job = self.after_idle(self._process_motion)
+    
+    def _process_motion(self):
+        """Update anther highlights and the cursor for the latest position."""
+        self._motion_job = None
+        if self.completed or self._motion_pos is None:
+            return
+        ex, ey = self._motion_pos
+        
+        # Anthers under the pointer
+        hovered = {anther.id for anther in self._anthers_at(ex, ey)}
+        
+        # Only anthers whose hover state changed are reconfigured
+        if hovered != self._hovered:
+            for anther in self._active_anthers:
+                aid = anther.id
+                if (aid in hovered) == (aid in self._hovered):
+                    continue
+                if aid in hovered:
+                    # Highlight the anther with thicker bright orange outline
+                    self.canvas.itemconfig(anther.body, image=self._sprite_hover)
+                else:
+                    # Reset to normal orange outline
+                    self.canvas.itemconfig(anther.body, image=self._sprite_normal)
+            self._hovered = hovered
         
         # Update cursor
+        hovering = bool(hovered)
+        custom = self.has_custom_cursor and self.cursor_icon
+        if hovering and custom:
+            # Custom tweezer icon follows the mouse
+            self.canvas.coords(self.cursor_icon, ex, ey)
+        if hovering == self._hover_cursor:
+            return
+        self._hover_cursor = hovering
         if hovering:
-            if self.has_custom_cursor and self.cursor_icon:
-                # Show custom tweezer cursor icon at mouse position
-                self.canvas.coords(self.cursor_icon, event.x, event.y)
+            if custom:
+                # Show custom tweezer cursor icon, hide system cursor
                 self.canvas.itemconfig(self.cursor_icon, state='normal')
-                # Hide system cursor
                 self.canvas.config(cursor="none")
             else:
                 # Fallback to hand cursor
                 self.canvas.config(cursor="hand2")
         else:
-            if self.has_custom_cursor and self.cursor_icon:
+            if custom:
                 # Hide custom cursor icon
                 self.canvas.itemconfig(self.cursor_icon, state='hidden')
-                # Show crosshair
-                self.canvas.config(cursor="crosshair")
-            else:
-                self.canvas.config(cursor="crosshair")
+            # Show crosshair
+            self.canvas.config(cursor="crosshair")
     
     def _on_canvas_click(self, event):
         """Handle click on canvas to check if an anther was clicked."""
         if self.completed:
             return
         
-        # Check each anther
-        for anther in self.anthers:
-            if anther["removed"]:
+        # First remaining anther within the (scaled) click tolerance
+        hits = self._anthers_at(event.x, event.y)
+        if hits:
+            anther = hits[0]
+            self._remove_anther(anther)
+            print(f"Clicked anther {anther.id} at ({event.x}, {event.y})")
+    
+    def _anthers_at(self, x, y):
+        """Remaining anthers within click tolerance of (x, y), in creation order."""
+        tol2 = self._tol2
+        hits = []
+        for anther in self._active_anthers:
+            # Bounding-box reject first, then squared distance (no sqrt)
+            dx = x - anther.x
+            if dx * dx >= tol2:
                 continue
-            
-            # Check if click is within anther bounds
-            dx = event.x - anther["x"]
-            dy = event.y - anther["y"]
-            distance = math.sqrt(dx * dx + dy * dy)
-            
-            if distance < self.click_tolerance:  # Use scaled tolerance
-                self._remove_anther(anther)
-                print(f"Clicked anther {anther['id']} at ({event.x}, {event.y})")
-                break
+            dy = y - anther.y
+            if dx * dx + dy * dy < tol2:
+                hits.append(anther)
+        return hits
     
     def _remove_anther(self, anther):
         """Remove an anther from the flower."""
         # Mark as removed
-        anther["removed"] = True
+        anther.removed = True
+        self._active_anthers.remove(anther)
+        self._hovered.discard(anther.id)
         self.anthers_removed += 1
         
-        # Animate removal with color fade
-        def fade_out(step=0):
-            if step == 0:
-                # Flash red briefly
-                self.canvas.itemconfig(anther["body"], fill="#ff4444", outline="#cc0000")
-            elif step == 1:
-                # Fade to gray
-                self.canvas.itemconfig(anther["body"], fill="#888888", outline="#666666")
-            elif step == 2:
-                # Final fade
-                self.canvas.itemconfig(anther["body"], fill="#444444", outline="#333333")
-            elif step == 3:
-                # Delete anther, stalk, and pollen
-                self.canvas.delete(anther["body"])
-                self.canvas.delete(anther["stalk"])
-                # Delete pollen dots by tag
-                self.canvas.delete(f"anther_{anther['id']}_pollen")
-                return
-            
-            self.canvas.after(80, lambda: fade_out(step + 1))
-        
-        fade_out()
+        # Animate removal with color fade (first frame now, the rest from
+        # the shared fade timer)
+        self.canvas.itemconfig(anther.body, image=self._sprite_fade[0])
+        self._fade_queue.append([anther, 0])
+        if self._fade_job is None:
+            self._fade_job = self.after(FADE_FRAME_MS, self._tick_fades)
         
         # Update progress
         remaining = self.total_anthers - self.anthers_removed
@@ -460,15 +588,33 @@ class EmasculationDialog(tk.Toplevel):
             )
             self.canvas.after(300, self._complete_emasculation)
     
+    def _tick_fades(self):
+        """Advance every fading anther one frame; delete those that finished."""
+        self._fade_job = None
+        still_fading = []
+        for entry in self._fade_queue:
+            anther, stage = entry[0], entry[1] + 1
+            if stage < len(FADE_COLORS):
+                self.canvas.itemconfig(anther.body, image=self._sprite_fade[stage])
+                entry[1] = stage
+                still_fading.append(entry)
+            else:
+                # Delete anther (pollen dot included) and stalk
+                self.canvas.delete(anther.body, anther.stalk)
+        self._fade_queue = still_fading
+        if still_fading:
+            self._fade_job = self.after(FADE_FRAME_MS, self._tick_fades)
+    
     def _complete_emasculation(self):
         """Complete the emasculation procedure."""
         self.completed = True
         
         # Show success message in pre-allocated frame
+        self.success_frame.config(bg="#e8f5e9")
         self.success_label.config(
-            text="Success!"
+            text="Success!",
+            bg="#e8f5e9"
         )
-        self.success_label.pack(fill="x")
         
         # Change cancel button to close
         self.cancel_btn.config(text="Close", command=self._on_complete)
@@ -491,3 +637,14 @@ class EmasculationDialog(tk.Toplevel):
     def _on_close(self):
         """Handle window close button."""
         self._on_cancel()
+    
+    def destroy(self):
+        """Cancel pending hover / fade callbacks before the window goes away."""
+        for job in (self._motion_job, self._fade_job):
+            if job is not None:
+                try:
+                    self.after_cancel(job)
+                except tk.TclError:
+                    pass
+        self._motion_job = self._fade_job = None
+        super().destroy()
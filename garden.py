@@ -11,7 +11,7 @@ Manages the garden simulation environment including:
 import datetime as dt
 import math
 import random
-from typing import List, Set
+from typing import Dict, List, Set
 
 from mendelclimate import MendelClimate
 from plant import Plant
@@ -24,6 +24,9 @@ from plant import Plant
 # Brno, Czech Republic coordinates (Mendel's monastery)
 BRNO_LAT = 49.1951
 BRNO_LON = 16.6068
+# Local hours that are daylight in Brno on every day of the year (latest
+# sunrise ~7:48, earliest sunset ~15:56)
+BRNO_ALWAYS_DAY = (8.0, 15.5)
 
 # Time phases
 PHASES = ("morning", "noon", "afternoon", "evening")
@@ -34,10 +37,77 @@ PHASE_DISPLAY = {
     "evening": "🌆 Evening",
 }
 
+# (phase name, phase index) for each clock hour 0-23
+HOUR_TO_PHASE = (
+    (('night', 0),) * 6          # 0-5
+    + (('morning', 0),) * 5      # 6-10
+    + (('noon', 1),) * 3         # 11-13
+    + (('afternoon', 2),) * 4    # 14-17
+    + (('evening', 3),) * 5      # 18-22
+    + (('night', 0),)            # 23
+)
+
 # Weather symbols and their base probabilities
 WEATHER_SYMBOLS = ("☀️", "⛅", "☁️", "🌧", "⛈")
 WEATHER_WEIGHTS = (0.45, 0.25, 0.15, 0.12, 0.03)
 
+# Hourly sky weights (☀️, ⛅, ☁️) for cloudiness <3, <5, <7 and above
+SKY_WEIGHTS = (
+    (0.70, 0.30, 0.00),
+    (0.30, 0.60, 0.10),
+    (0.15, 0.55, 0.30),
+    (0.05, 0.35, 0.60),
+)
+
+# Reseeded for every hourly weather evaluation (saves allocating a new
+# generator each hour); only used from the simulation thread
+_WEATHER_RNG = random.Random()
+
+# Days of climate state / hourly temperatures kept per garden
+DAY_TEMPS_CACHE_SIZE = 32
+
+# Day/night caches: the answers depend only on the date, and weather is
+# re-evaluated every simulated hour
+_DST_BOUNDS = {}  # year -> (dst_start, dst_end)
+_SUN_TIMES = {}  # (date ordinal, lat, lon) -> (sunrise, sunset) local hours
+_SUN_TIMES_MAX = 4096  # entries kept before the cache is cleared
+
+# NOAA solar terms per day of year (index 1-366), filled on first use:
+# (equation of time in minutes, sin(declination), cos(declination))
+_SOLAR_TABLE = [None] * 367
+# cos of the sunrise/sunset solar zenith (~90.833°)
+_COS_ZENITH = math.cos(math.radians(90.833))
+
+
+def _solar_terms(day_of_year):
+    """Equation of time and declination sine/cosine for a day of the year."""
+    terms = _SOLAR_TABLE[day_of_year]
+    if terms is None:
+        # Fractional year in radians
+        gamma = 2.0 * math.pi / 365.0 * (day_of_year - 1)
+        
+        # Equation of time (minutes)
+        eqtime = 229.18 * (
+            0.000075
+            + 0.001868 * math.cos(gamma)
+            - 0.032077 * math.sin(gamma)
+            - 0.014615 * math.cos(2 * gamma)
+            - 0.040849 * math.sin(2 * gamma)
+        )
+        
+        # Solar declination (radians)
+        decl = (
+            0.006918
+            - 0.399912 * math.cos(gamma)
+            + 0.070257 * math.sin(gamma)
+            - 0.006758 * math.cos(2 * gamma)
+            + 0.000907 * math.sin(2 * gamma)
+            - 0.002697 * math.cos(3 * gamma)
+            + 0.00148 * math.sin(3 * gamma)
+        )
+        terms = _SOLAR_TABLE[day_of_year] = (eqtime, math.sin(decl), math.cos(decl))
+    return terms
+
 
 # ============================================================================
 # Garden Environment
@@ -58,8 +128,9 @@ class GardenEnvironment:
         Args:
             size: Garden grid size (not directly used by environment)
         """
-        # Plant registry
+        # Plant registry, plus an id index kept in step with it
         self.plants: Set[Plant] = set()
+        self.plants_by_id: Dict[int, Plant] = {}
         
         # Time tracking
         self.day = 1
@@ -72,17 +143,41 @@ class GardenEnvironment:
         self.month = 4
         self.day_of_month = 1
         self._month_lengths = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
+        self._current_date = None  # cached dt.date, reset when the calendar moves
         
         # Weather
         self.weather = random.choices(WEATHER_SYMBOLS, weights=WEATHER_WEIGHTS)[0]
         
-        # Temperature
+        # Weather evaluation cache (prevent duplicate work); set before the
+        # first temperature generation, which also evaluates the weather
+        self._last_weather_eval_key = None
+        
+        # Temperature. Climate states and day temperature results are kept
+        # by date ordinal, oldest first
+        self._climate_states = {}
+        self._day_temps_cache = {}
         self.temp = 12.0
         self.target_temps = self._generate_day_temperatures()
         self.temp_updates_remaining = 3
         
-        # Weather evaluation cache (prevent duplicate work)
-        self._last_weather_eval_key = None
+        # Set whenever plant, weather or calendar state visibly changes;
+        # fast-forward clears it after each full redraw
+        self._dirty = True
+    
+    @property
+    def current_date(self) -> dt.date:
+        """
+        Current simulation date.
+        
+        Built once per simulated day; anything that assigns year/month/
+        day_of_month directly must reset _current_date to None.
+        """
+        d = self._current_date
+        if d is None:
+            d = self._current_date = dt.date(
+                int(self.year), int(self.month), int(self.day_of_month)
+            )
+        return d
     
     # ========================================================================
     # Plant Management
@@ -91,10 +186,24 @@ class GardenEnvironment:
     def register_plant(self, plant: Plant):
         """Add a plant to the environment registry."""
         self.plants.add(plant)
+        self.plants_by_id[plant.id] = plant
     
     def unregister_plant(self, plant: Plant):
         """Remove a plant from the environment registry."""
         self.plants.discard(plant)
+        if self.plants_by_id.get(plant.id) is plant:
+            del self.plants_by_id[plant.id]
+    
+    def _unregister_all(self, plants):
+        """Remove plants collected during a registry scan, and mark dirty."""
+        for plant in plants:
+            self.unregister_plant(plant)
+        self._dirty = True
+    
+    def clear_plants(self):
+        """Remove every plant from the environment registry."""
+        self.plants.clear()
+        self.plants_by_id.clear()
     
     # ========================================================================
     # Time Progression
@@ -112,158 +221,128 @@ class GardenEnvironment:
         - Midnight rollover (day change, growth)
         """
         # Finish temperature convergence for current hour
-        try:
-            while getattr(self, 'temp_updates_remaining', 0) > 0:
-                self.drift_temperature_once()
-        except Exception:
-            pass
+        while self.temp_updates_remaining > 0:
+            self.drift_temperature_once()
         
-        # Update all living plants
-        for plant in list(self.plants):
+        # Update all living plants (dead ones are unregistered afterwards,
+        # so the registry is iterated without copying it)
+        weather = self.weather
+        temp = float(self.temp)
+        dead = []
+        for plant in self.plants:
             if plant.alive:
+                before = (plant.water, plant.health)
                 try:
-                    plant.tick_hour(
-                        getattr(self, 'weather', '☀️'),
-                        float(getattr(self, 'temp', 15.0))
-                    )
+                    plant.tick_hour(weather, temp)
                 except Exception:
                     # Fallback to phase-based update
                     try:
-                        plant.tick_phase(getattr(self, 'weather', '☀️'))
+                        plant.tick_phase(weather)
                     except Exception:
                         pass
+                if not plant.alive or (plant.water, plant.health) != before:
+                    self._dirty = True
             else:
-                self.unregister_plant(plant)
+                dead.append(plant)
+        if dead:
+            self._unregister_all(dead)
         
         # Advance clock
-        try:
-            self.clock_hour = (int(getattr(self, 'clock_hour', 6)) + 1) % 24
-        except Exception:
-            self.clock_hour = 6
+        hour = self.clock_hour = (int(self.clock_hour) + 1) % 24
         
-        # Update weather for new hour
+        # Update weather for new hour (climate data is external; a failure
+        # keeps the previous weather)
         try:
-            sim_date = dt.date(
-                int(self.year),
-                int(self.month),
-                int(self.day_of_month)
-            )
-            hour = int(getattr(self, 'clock_hour', 6)) % 24
-            prev_icon = getattr(self, 'weather', None)
-            
             self._recompute_weather_for_date(
-                sim_date,
+                self.current_date,
                 hour=hour,
-                prev_icon=prev_icon,
+                prev_icon=weather,
                 stickiness=0.75
             )
+            if self.weather != weather:
+                self._dirty = True
         except Exception:
             pass
         
-        # Refresh UI (if available)
-        try:
-            self._refresh_header()
-        except Exception:
-            try:
-                self.update_ui()
-            except Exception:
-                pass
-        
         # Sync phase from clock
-        try:
-            self._sync_phase()
-        except Exception:
-            pass
+        self._sync_phase()
         
         # Midnight rollover
-        if int(self.clock_hour) == 0:
+        if hour == 0:
             self._handle_midnight_rollover()
         
         # Reset temperature updates and apply first drift
-        try:
-            self.temp_updates_remaining = 3
-            self.drift_temperature_once()
-        except Exception:
-            pass
+        self.temp_updates_remaining = 3
+        self.drift_temperature_once()
     
     def _handle_midnight_rollover(self):
         """Handle day change at midnight."""
+        self._dirty = True
+        
         # Advance calendar
-        try:
-            self._cal_advance_one_day()
-        except Exception:
-            pass
+        self._cal_advance_one_day()
         
-        # Regenerate temperatures and weather for new day
+        # Regenerate temperatures and weather for new day (climate data is
+        # external; a failure keeps yesterday's targets)
         try:
-            temps = self._generate_day_temperatures()
-            if isinstance(temps, dict):
-                self.target_temps = temps
+            self.target_temps = self._generate_day_temperatures()
         except Exception:
             pass
         
-        # Update all plants for new day
-        for plant in list(self.plants):
+        # Only apply garden.py senescence decline in casual mode
+        # (overlay/enforce modes use pea_season_model.py for senescence)
+        app = getattr(self, '_app', None)
+        season_mode = str(getattr(app, '_season_mode', 'off')) if app else 'off'
+        casual = season_mode == 'off'
+        
+        # Update all plants for new day (the per-plant guards keep one
+        # plant with bad restored state from stopping the others)
+        dead = []
+        uniform = random.uniform
+        randint = random.randint
+        for plant in self.plants:
             if plant.alive:
                 # Age the plant
-                plant.days_since_planting = int(plant.days_since_planting) + 1
+                age = plant.days_since_planting = int(plant.days_since_planting) + 1
                 
                 # Check senescence and lifespan
                 try:
                     max_age = int(plant.max_age_days)
-                    age = int(plant.days_since_planting)
                     
                     # Senescence starts 10 days before max age
                     if age >= max(0, max_age - 10):
                         plant.senescent = True
                         
-                        # Only apply garden.py senescence decline in casual mode
-                        # (overlay/enforce modes use pea_season_model.py for senescence)
-                        try:
-                            app = getattr(self, '_app', None)
-                            season_mode = str(getattr(app, '_season_mode', 'off')) if app else 'off'
-                        except:
-                            season_mode = 'off'
-                        
-                        if season_mode == 'off':
+                        if casual:
                             # Gradual health decline with some variation (±10%)
-                            import random
                             base_decline = 2
-                            variation = random.uniform(0.9, 1.1)
+                            variation = uniform(0.9, 1.1)
                             decline = int(base_decline * variation)
                             plant.health = max(0, int(plant.health) - decline)
                     
                     # At max age, accelerate health decline — but only in casual mode.
                     # overlay/enforce use pea_season_model.py which handles this;
                     # stacking both causes instant death right at the harvest window.
-                    if age >= max_age and season_mode == 'off':
-                        import random
-                        severe_decline = random.randint(8, 15)
+                    if age >= max_age and casual:
+                        severe_decline = randint(8, 15)
                         plant.health = max(0, int(plant.health) - severe_decline)
                         
                         # Only die when health reaches 0 (natural death)
                         if plant.health <= 0:
                             plant.alive = False
-                            try:
-                                plant.stage = max(int(plant.stage), 7)
-                            except Exception:
-                                pass
+                            plant.stage = max(int(plant.stage), 7)
                 except Exception:
                     pass
                 
                 # Advance growth stage (may advance multiple stages if far enough)
                 try:
-                    # Keep advancing while possible (handles skipped days/fast forward)
-                    max_iterations = 10  # Safety limit to prevent infinite loops
-                    for _ in range(max_iterations):
-                        old_stage = plant.stage
-                        plant.advance_growth()
-                        if plant.stage == old_stage or plant.stage >= 7:
-                            break  # No advancement or reached maturity
+                    plant.catch_up_growth()
                 except Exception:
                     pass
             else:
-                self.unregister_plant(plant)
+                dead.append(plant)
+        if dead:
+            self._unregister_all(dead)
     
     def next_phase(self):
         """Legacy method: advance by one hour (same as next_hour)."""
@@ -271,16 +350,7 @@ class GardenEnvironment:
     
     def _sync_phase(self):
         """Synchronize phase string and index from current clock hour."""
-        try:
-            phase_name, phase_idx = self._hour_to_phase(int(getattr(self, 'clock_hour', 6)))
-            self.phase = phase_name
-            self.phase_index = phase_idx
-        except Exception:
-            try:
-                self.phase = getattr(self, 'phase', 'morning')
-                self.phase_index = getattr(self, 'phase_index', 0)
-            except Exception:
-                pass
+        self.phase, self.phase_index = self._hour_to_phase(int(self.clock_hour))
     
     def _hour_to_phase(self, hour: int):
         """
@@ -292,19 +362,13 @@ class GardenEnvironment:
         Returns:
             Tuple of (phase_name, phase_index)
         """
-        if 6 <= hour < 11:
-            return 'morning', 0
-        elif 11 <= hour < 14:
-            return 'noon', 1
-        elif 14 <= hour < 18:
-            return 'afternoon', 2
-        elif 18 <= hour <= 22:
-            return 'evening', 3
-        else:
-            return 'night', 0
+        if 0 <= hour < 24:
+            return HOUR_TO_PHASE[hour]
+        return 'night', 0
     
     def _cal_advance_one_day(self):
         """Advance the calendar by one day."""
+        self._current_date = None
         try:
             self.day_of_month += 1
             month_length = self._month_lengths[self.month - 1]
@@ -334,21 +398,13 @@ class GardenEnvironment:
             stickiness: Probability of weather persisting (0.0-1.0)
         """
         # Check cache to avoid duplicate evaluation
-        try:
-            cache_key = (int(sim_date.toordinal()), int(hour) if hour is not None else -1)
-            if getattr(self, "_last_weather_eval_key", None) == cache_key:
-                return
-            self._last_weather_eval_key = cache_key
-        except Exception:
-            pass
-        
-        # Get or create climate singleton
-        climate = globals().get("_CLIMATE_V2_SINGLETON", None)
-        if climate is None:
-            climate = self._init_climate_singleton()
+        cache_key = (sim_date.toordinal(), -1 if hour is None else int(hour))
+        if self._last_weather_eval_key == cache_key:
+            return
+        self._last_weather_eval_key = cache_key
         
         # Get daily state from climate model
-        state = climate.daily_state(sim_date)
+        state = self._climate_state(sim_date)
         
         # Determine time slot for hourly evaluation
         time_slot = 0 if hour is None else int(hour) % 24
@@ -377,36 +433,44 @@ class GardenEnvironment:
         # Temperature bias (warmer hours → more sun, cooler → more clouds)
         temp_bias = self._compute_temperature_bias(state, time_slot)
         
-        # Base weights from cloudiness
+        # Base weights (☀️, ⛅, ☁️) from cloudiness
         if cloudiness < 3:
-            weights = [0.70, 0.30, 0.00]  # ☀️, ⛅, ☁️
+            w_sun, w_part, w_cloud = SKY_WEIGHTS[0]
         elif cloudiness < 5:
-            weights = [0.30, 0.60, 0.10]
+            w_sun, w_part, w_cloud = SKY_WEIGHTS[1]
         elif cloudiness < 7:
-            weights = [0.15, 0.55, 0.30]
+            w_sun, w_part, w_cloud = SKY_WEIGHTS[2]
         else:
-            weights = [0.05, 0.35, 0.60]
+            w_sun, w_part, w_cloud = SKY_WEIGHTS[3]
         
         # Apply temperature bias
-        try:
-            boost = 0.25
-            if temp_bias > 0:
-                weights[0] += boost * temp_bias
-                weights[2] -= boost * temp_bias
-            elif temp_bias < 0:
-                weights[2] += boost * (-temp_bias)
-                weights[0] -= boost * (-temp_bias)
-            
-            # Normalize weights
-            weights = [max(0.0, min(1.0, w)) for w in weights]
-            total = sum(weights) or 1.0
-            weights = [w / total for w in weights]
-        except Exception:
-            pass
-        
-        # Deterministic RNG for this hour
-        rng = random.Random((int(sim_date.toordinal()) * 24 + time_slot) ^ 0xA5F17D)
-        candidate = rng.choices(['☀️', '⛅', '☁️'], weights=weights)[0]
+        boost = 0.25
+        if temp_bias > 0:
+            w_sun += boost * temp_bias
+            w_cloud -= boost * temp_bias
+        elif temp_bias < 0:
+            w_cloud += boost * (-temp_bias)
+            w_sun -= boost * (-temp_bias)
+        
+        # Normalize weights
+        w_sun = max(0.0, min(1.0, w_sun))
+        w_part = max(0.0, min(1.0, w_part))
+        w_cloud = max(0.0, min(1.0, w_cloud))
+        total = w_sun + w_part + w_cloud or 1.0
+        w_sun, w_part, w_cloud = w_sun / total, w_part / total, w_cloud / total
+        
+        # Deterministic RNG for this hour (one shared generator, reseeded)
+        rng = _WEATHER_RNG
+        rng.seed((int(sim_date.toordinal()) * 24 + time_slot) ^ 0xA5F17D)
+        # Weighted pick; same draw and thresholds as rng.choices()
+        cum_part = w_sun + w_part
+        x = rng.random() * (cum_part + w_cloud)
+        if x < w_sun:
+            candidate = '☀️'
+        elif x < cum_part:
+            candidate = '⛅'
+        else:
+            candidate = '☁️'
         
         # Apply weather persistence (stickiness)
         try:
@@ -441,13 +505,41 @@ class GardenEnvironment:
             hours = state.get('hours') or []
             if isinstance(hours, (list, tuple)) and len(hours) == 24:
                 temp_hour = float(hours[time_slot])
-                temp_mean = sum(hours) / 24.0
+                temp_mean = state.get('mean')
+                if temp_mean is None:
+                    temp_mean = sum(hours) / 24.0
                 bias = max(-1.0, min(1.0, (temp_hour - temp_mean) / 6.0))
                 return bias
         except Exception:
             pass
         return 0.0
     
+    def _climate_state(self, sim_date):
+        """
+        MendelClimate daily state for a date, with its hourly 'mean' added.
+        
+        daily_state() is deterministic per date, so each day's state is
+        computed once and shared by every hourly weather evaluation.
+        Callers must treat the returned dict as read-only.
+        """
+        key = sim_date.toordinal()
+        state = self._climate_states.get(key)
+        if state is None:
+            # Get or create climate singleton
+            climate = globals().get("_CLIMATE_V2_SINGLETON", None)
+            if climate is None:
+                climate = self._init_climate_singleton()
+            
+            state = dict(climate.daily_state(sim_date))
+            hours = state.get('hours')
+            if isinstance(hours, (list, tuple)) and len(hours) == 24:
+                state['mean'] = sum(hours) / 24.0
+            if len(self._climate_states) >= DAY_TEMPS_CACHE_SIZE:
+                # Evict the oldest date
+                del self._climate_states[next(iter(self._climate_states))]
+            self._climate_states[key] = state
+        return state
+    
     def _init_climate_singleton(self):
         """Initialize the MendelClimate singleton."""
         try:
@@ -485,23 +577,27 @@ class GardenEnvironment:
         day = int(getattr(self, 'day_of_month', 1))
         sim_date = dt.date(year, month, day)
         
-        # Get or create climate singleton
-        climate = globals().get('_CLIMATE_V2_SINGLETON', None)
-        if climate is None:
-            climate = self._init_climate_singleton()
-        
-        # Get hourly temperatures from climate model
-        state = climate.daily_state(sim_date)
-        hours = state.get('hours') or [15.0] * 24
-        
-        # Compute phase averages
-        result = {
-            'hours': hours,
-            'morning': sum(hours[6:11]) / 5.0,
-            'noon': sum(hours[11:14]) / 3.0,
-            'afternoon': sum(hours[14:18]) / 4.0,
-            'evening': sum(hours[18:23]) / 5.0,
-        }
+        # The climate model is deterministic per date: reuse earlier results
+        key = sim_date.toordinal()
+        cached = self._day_temps_cache.get(key)
+        if cached is None:
+            # Get hourly temperatures from climate model
+            state = self._climate_state(sim_date)
+            hours = state.get('hours') or [15.0] * 24
+            
+            # Compute phase averages
+            cached = {
+                'hours': hours,
+                'morning': (hours[6] + hours[7] + hours[8] + hours[9] + hours[10]) / 5.0,
+                'noon': (hours[11] + hours[12] + hours[13]) / 3.0,
+                'afternoon': (hours[14] + hours[15] + hours[16] + hours[17]) / 4.0,
+                'evening': (hours[18] + hours[19] + hours[20] + hours[21] + hours[22]) / 5.0,
+            }
+            if len(self._day_temps_cache) >= DAY_TEMPS_CACHE_SIZE:
+                # Evict the oldest date
+                del self._day_temps_cache[next(iter(self._day_temps_cache))]
+            self._day_temps_cache[key] = cached
+        result = dict(cached)
         
         # Also update weather for the new day
         try:
@@ -563,18 +659,23 @@ class GardenEnvironment:
         Returns:
             2 for CEST (summer), 1 for CET (winter)
         """
-        def last_sunday(year, month):
-            # Find last day of month
-            if month == 12:
-                last_day = dt.date(year, 12, 31)
-            else:
-                last_day = dt.date(year, month + 1, 1) - dt.timedelta(days=1)
+        bounds = _DST_BOUNDS.get(date.year)
+        if bounds is None:
+            def last_sunday(year, month):
+                # Find last day of month
+                if month == 12:
+                    last_day = dt.date(year, 12, 31)
+                else:
+                    last_day = dt.date(year, month + 1, 1) - dt.timedelta(days=1)
+                
+                # Find last Sunday (weekday: Monday=0, Sunday=6)
+                return last_day - dt.timedelta(days=(last_day.weekday() + 1) % 7)
             
-            # Find last Sunday (weekday: Monday=0, Sunday=6)
-            return last_day - dt.timedelta(days=(last_day.weekday() + 1) % 7)
-        
-        dst_start = last_sunday(date.year, 3)
-        dst_end = last_sunday(date.year, 10)
+            # DST boundaries only change with the year
+            bounds = _DST_BOUNDS[date.year] = (
+                last_sunday(date.year, 3), last_sunday(date.year, 10)
+            )
+        dst_start, dst_end = bounds
         
         return 2 if (date >= dst_start and date < dst_end) else 1
     
@@ -590,40 +691,20 @@ class GardenEnvironment:
         Returns:
             Tuple of (sunrise_hour, sunset_hour) in local time (0-24)
         """
-        # Day of year
-        day_of_year = date.timetuple().tm_yday
+        # Computed once per (date, location); hourly weather asks repeatedly
+        key = (date.toordinal(), lat, lon)
+        cached = _SUN_TIMES.get(key)
+        if cached is not None:
+            return cached
         
-        # Fractional year in radians
-        gamma = 2.0 * math.pi / 365.0 * (day_of_year - 1)
-        
-        # Equation of time (minutes)
-        eqtime = 229.18 * (
-            0.000075
-            + 0.001868 * math.cos(gamma)
-            - 0.032077 * math.sin(gamma)
-            - 0.014615 * math.cos(2 * gamma)
-            - 0.040849 * math.sin(2 * gamma)
-        )
-        
-        # Solar declination (radians)
-        decl = (
-            0.006918
-            - 0.399912 * math.cos(gamma)
-            + 0.070257 * math.sin(gamma)
-            - 0.006758 * math.cos(2 * gamma)
-            + 0.000907 * math.sin(2 * gamma)
-            - 0.002697 * math.cos(3 * gamma)
-            + 0.00148 * math.sin(3 * gamma)
-        )
+        # Equation of time and solar declination for the day of year
+        eqtime, sin_decl, cos_decl = _solar_terms(date.timetuple().tm_yday)
         
         lat_rad = math.radians(lat)
         
-        # Solar zenith for sunrise/sunset (~90.833°)
-        zenith = math.radians(90.833)
-        
         # Hour angle
-        cos_ha = (math.cos(zenith) - math.sin(lat_rad) * math.sin(decl)) / (
-            math.cos(lat_rad) * math.cos(decl)
+        cos_ha = (_COS_ZENITH - math.sin(lat_rad) * sin_decl) / (
+            math.cos(lat_rad) * cos_decl
         )
         # Clamp for polar edge cases
         cos_ha = max(-1.0, min(1.0, cos_ha))
@@ -646,6 +727,9 @@ class GardenEnvironment:
         sunrise_local %= 24.0
         sunset_local %= 24.0
         
+        if len(_SUN_TIMES) >= _SUN_TIMES_MAX:
+            _SUN_TIMES.clear()
+        _SUN_TIMES[key] = (sunrise_local, sunset_local)
         return sunrise_local, sunset_local
     
     def _is_night_in_brno(self, sim_date, hour_float: float) -> bool:
@@ -687,9 +771,13 @@ class GardenEnvironment:
         Returns:
             Adjusted icon (🌙 for sun/partly cloudy at night)
         """
+        if icon not in ("☀️", "⛅"):
+            return icon
+        # Daylight all year: no sunrise/sunset lookup needed
+        if BRNO_ALWAYS_DAY[0] <= float(hour_float) % 24.0 < BRNO_ALWAYS_DAY[1]:
+            return icon
         if self._is_night_in_brno(sim_date, hour_float):
-            if icon in ("☀️", "⛅"):
-                return "🌙"
+            return "🌙"
         return icon
     
     # ========================================================================
@@ -711,12 +799,19 @@ class GardenEnvironment:
             return "It's raining — manual watering not needed."
         
         count = 0
-        for plant in list(self.plants) if self.plants else []:
+        dead = []
+        phase = self.phase
+        for plant in self.plants:
             if plant.alive:
-                plant.water_plant(self.phase)
+                plant.water_plant(phase)
                 count += 1
             else:
-                self.unregister_plant(plant)
+                dead.append(plant)
+        if dead:
+            self._unregister_all(dead)
+        
+        if count:
+            self._dirty = True
         
         return f"Watered {count} plants."
     
@@ -732,12 +827,19 @@ class GardenEnvironment:
             return "It's raining — manual watering not needed."
         
         count = 0
-        for plant in list(self.plants) if self.plants else []:
+        dead = []
+        for plant in self.plants:
             if plant.alive:
-                plant.water = min(100, plant.water + 30)
+                water = plant.water + 30
+                plant.water = water if water < 100 else 100
                 count += 1
             else:
-                self.unregister_plant(plant)
+                dead.append(plant)
+        if dead:
+            self._unregister_all(dead)
+        
+        if count:
+            self._dirty = True
         
         return f"Watered {count} plants safely."
     
@@ -756,16 +858,22 @@ class GardenEnvironment:
             return "It's raining — skipping smart watering."
         
         count = 0
-        for plant in list(self.plants) if self.plants else []:
-            if not getattr(plant, "alive", True):
-                self.unregister_plant(plant)
+        dead = []
+        for plant in self.plants:
+            if not plant.alive:
+                dead.append(plant)
                 continue
             
-            water_level = int(getattr(plant, "water", 0))
+            water_level = int(plant.water)
             if water_level < 55:
                 target = 65
                 amount = min(30, max(0, target - water_level))
                 plant.water = min(70, water_level + amount)
                 count += 1
+        if dead:
+            self._unregister_all(dead)
+        
+        if count:
+            self._dirty = True
         
         return f"Smart-watered {count} plants (to ≤70)."
@@ -24,6 +24,8 @@ from icon_loader import *
 @dataclass
 class InventoryItem:
     """Base class for inventory items."""
+    __slots__ = ('name', 'id')
+
     name: str
     id: int
 
@@ -34,7 +36,11 @@ class Seed(InventoryItem):
     Represents a harvested seed.
     
     Contains genetic information and lineage data for planting.
+    Slotted: harvests can fill the inventory with thousands of seeds.
     """
+    __slots__ = ('source_id', 'donor_id', 'traits', 'generation',
+                 'pod_index', 'genotype', 'ancestry')
+
     source_id: int  # Maternal plant ID
     donor_id: Optional[int]  # Paternal plant ID (None for selfed seeds)
     traits: dict
@@ -107,6 +113,32 @@ class Pollen(InventoryItem):
         except Exception:
             pass
 
+    @classmethod
+    def _from_state(cls, state):
+        """
+        Rebuild pollen from saved attributes without running __post_init__.
+
+        __post_init__ would re-derive source_id (and empty genotype/traits)
+        from the source plant, which is not kept in saves.
+
+        Args:
+            state: Mapping of field name -> value (must include name and id)
+
+        Returns:
+            The restored Pollen, with no source_plant
+        """
+        pollen = cls.__new__(cls)
+        pollen.source_plant = None
+        pollen.collection_time = 0
+        pollen.source_id = 0
+        pollen.collected_day = 0
+        pollen.expires_day = 0
+        pollen.genotype = {}
+        pollen.traits = {}
+        for key, value in state.items():
+            setattr(pollen, key, value)
+        return pollen
+
     def __repr__(self):
         return (f"Pollen(source_id={self.source_id}, "
                 f"collected_day={self.collected_day}, "
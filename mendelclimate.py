@@ -105,6 +105,9 @@ class MendelClimate:
         self.sigma = 1.8  # Original working value
         self.rng = random.Random(seed)
         
+        # Per-(year, month) discrete event draws, see _month_events()
+        self._month_events_cache = {}
+        
         # Amplitude scaling parameters (balanced for realistic variation without overshooting)
         self.clear_amp = 1.2      # Reduced from 1.6 to 1.2 (was making afternoons too hot)
         self.overcast_amp = 0.65  # Reduced from 0.7 to 0.65
@@ -532,49 +535,12 @@ class MendelClimate:
         # Precipitation and Discrete Events
         # ====================================================================
         
-        m = date.month
-        rain_mm_total, rain_days = self.rain.get(m, (0.0, 0.0))
-        
-        # Days in month
-        if m == 12:
-            dim = (dt.date(date.year + 1, 1, 1) - dt.date(date.year, m, 1)).days
-        else:
-            dim = (dt.date(date.year, m + 1, 1) - dt.date(date.year, m, 1)).days
-        
-        # Rain days (deterministic per run via seeded RNG)
-        self.rng.seed((date.year * 100 + m))
-        rainy_set = set(
-            self.rng.sample(range(1, dim + 1), k=min(int(round(rain_days)), dim))
-            if rain_days > 0 else []
+        rainy_set, intensity_today, snow_set, th_set, hail_set = self._month_events(
+            date.year, date.month
         )
         rainy_today = date.day in rainy_set
-        intensity = 0.0
-        if rainy_today and rain_days > 0:
-            mean_int = rain_mm_total / max(1.0, rain_days)
-            intensity = mean_int * (0.5 + self.rng.random())
-        
-        # Snow days
-        snow_days = int(round(self.snow.get(m, 0.0)))
-        self.rng.seed((9999 + date.year * 100 + m))
-        snow_set = set(
-            self.rng.sample(range(1, dim + 1), k=min(snow_days, dim))
-            if snow_days > 0 else []
-        )
+        intensity = intensity_today if rainy_today else 0.0
         snow_today = date.day in snow_set
-        
-        # Thunder and hail
-        thunder_days = int(round(self.thunder.get(m, 0.0)))
-        hail_days = int(round(self.hail.get(m, 0.0)))
-        self.rng.seed((4444 + date.year * 100 + m))
-        th_set = set(
-            self.rng.sample(range(1, dim + 1), k=min(thunder_days, dim))
-            if thunder_days > 0 else []
-        )
-        self.rng.seed((5555 + date.year * 100 + m))
-        hail_set = set(
-            self.rng.sample(range(1, dim + 1), k=min(hail_days, dim))
-            if hail_days > 0 else []
-        )
         thunder_today = date.day in th_set
         hail_today = date.day in hail_set
         
@@ -639,6 +605,70 @@ class MendelClimate:
         """
         return self.daily_state(date)["hours"]
     
+    def _month_events(self, year, m):
+        """
+        Get the discrete weather event days for a month.
+        
+        The draws are seeded per (year, month), so they are identical for
+        every day of the month and cached after the first request.
+        
+        Args:
+            year: Calendar year
+            m: Month (1-12)
+            
+        Returns:
+            Tuple of (rainy_set, rain_intensity_mm, snow_set, thunder_set, hail_set)
+        """
+        key = (year, m)
+        hit = self._month_events_cache.get(key)
+        if hit is not None:
+            return hit
+        
+        rain_mm_total, rain_days = self.rain.get(m, (0.0, 0.0))
+        
+        # Days in month
+        if m == 12:
+            dim = (dt.date(year + 1, 1, 1) - dt.date(year, m, 1)).days
+        else:
+            dim = (dt.date(year, m + 1, 1) - dt.date(year, m, 1)).days
+        
+        # Rain days (deterministic per run via seeded RNG)
+        self.rng.seed((year * 100 + m))
+        rainy_set = frozenset(
+            self.rng.sample(range(1, dim + 1), k=min(int(round(rain_days)), dim))
+            if rain_days > 0 else []
+        )
+        intensity = 0.0
+        if rainy_set:
+            mean_int = rain_mm_total / max(1.0, rain_days)
+            intensity = mean_int * (0.5 + self.rng.random())
+        
+        # Snow days
+        snow_days = int(round(self.snow.get(m, 0.0)))
+        self.rng.seed((9999 + year * 100 + m))
+        snow_set = frozenset(
+            self.rng.sample(range(1, dim + 1), k=min(snow_days, dim))
+            if snow_days > 0 else []
+        )
+        
+        # Thunder and hail
+        thunder_days = int(round(self.thunder.get(m, 0.0)))
+        hail_days = int(round(self.hail.get(m, 0.0)))
+        self.rng.seed((4444 + year * 100 + m))
+        th_set = frozenset(
+            self.rng.sample(range(1, dim + 1), k=min(thunder_days, dim))
+            if thunder_days > 0 else []
+        )
+        self.rng.seed((5555 + year * 100 + m))
+        hail_set = frozenset(
+            self.rng.sample(range(1, dim + 1), k=min(hail_days, dim))
+            if hail_days > 0 else []
+        )
+        
+        hit = (rainy_set, intensity, snow_set, th_set, hail_set)
+        self._month_events_cache[key] = hit
+        return hit
+    
     def _frost_window(self, year):
         """
         Get frost season boundaries for a given year.
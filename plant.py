@@ -5,7 +5,7 @@ Defines the Plant class representing individual pea plants in the garden.
 Handles growth stages, trait revelation, watering, health, and reproduction.
 """
 
-from dataclasses import dataclass, field, InitVar
+from dataclasses import dataclass, field, fields, InitVar, MISSING
 import random
 from typing import Optional
 import tkinter as tk
@@ -72,6 +72,12 @@ class Plant:
     Represents a single pea plant in the garden.
     
     Tracks growth, health, water levels, trait revelation, and reproduction state.
+
+    Plants deliberately keep an instance __dict__ (no __slots__): several
+    attributes are attached at runtime (genotype, mother_id, sow_date,
+    death_day, img_obj, ...), tile rendering reads state through
+    plant.__dict__, and _from_state() restores saves with a single
+    __dict__.update().
     """
     
     # Core identity
@@ -140,6 +146,8 @@ class Plant:
 
     # Class-level icon cache (lazy-loaded)
     _ICONS = None
+    # (name, default, default_factory) per dataclass field, built by _from_state
+    _STATE_DEFAULTS = None
 
     def __post_init__(self, env):
         """Initialize plant after dataclass creation."""
@@ -147,15 +155,7 @@ class Plant:
         env.register_plant(self)
         
         # Get difficulty from environment (with fallback)
-        try:
-            # Try to get difficulty from the app via the garden environment
-            if hasattr(env, '_app'):
-                app = env._app
-                self.difficulty = str(getattr(app, '_season_mode', 'off'))
-            else:
-                self.difficulty = "off"
-        except Exception:
-            self.difficulty = "off"
+        self.difficulty = self._difficulty_from_env(env)
         
         # Set max_age based on difficulty
         if self.max_age_days == 0:  # Only set if not already set
@@ -236,6 +236,46 @@ class Plant:
         except Exception:
             pass
     
+    @staticmethod
+    def _difficulty_from_env(env):
+        """Read the difficulty (season mode) from the app behind env."""
+        try:
+            # Try to get difficulty from the app via the garden environment
+            if hasattr(env, '_app'):
+                return str(getattr(env._app, '_season_mode', 'off'))
+        except Exception:
+            pass
+        return "off"
+
+    @classmethod
+    def _from_state(cls, env, state):
+        """
+        Rebuild a plant from saved attributes without running __init__.
+
+        Skips the random draws in __post_init__ (lifespan, weak status,
+        default traits, pod/ovule counts) that a restore overwrites anyway.
+        Fields missing from state get their dataclass defaults.
+
+        Args:
+            env: GardenEnvironment to register the plant with
+            state: Mapping of attribute name -> value (must include 'id')
+
+        Returns:
+            The restored, registered Plant
+        """
+        if cls._STATE_DEFAULTS is None:
+            cls._STATE_DEFAULTS = tuple(
+                (f.name, f.default, f.default_factory) for f in fields(cls)
+            )
+        plant = cls.__new__(cls)
+        d = plant.__dict__
+        for name, default, factory in cls._STATE_DEFAULTS:
+            d[name] = default if factory is MISSING else factory()
+        d['difficulty'] = cls._difficulty_from_env(env)
+        d.update(state)
+        env.register_plant(plant)
+        return plant
+
     def __hash__(self):
         """Make plants hashable by ID."""
         return self.id
@@ -244,6 +284,24 @@ class Plant:
     # Growth & Trait Revelation
     # ========================================================================
     
+    def catch_up_growth(self, max_steps=10):
+        """
+        Call advance_growth() until the stage stops changing.
+        
+        Handles skipped days / fast forward, where a plant may be due
+        several stages at once.
+        
+        Args:
+            max_steps: Safety limit on the number of advances
+        """
+        stage = self.stage
+        for _ in range(max_steps):
+            self.advance_growth()
+            new_stage = self.stage
+            if new_stage == stage or new_stage >= 7:
+                break  # No advancement or reached maturity
+            stage = new_stage
+    
     def advance_growth(self):
         """
         Advance plant growth stage based on age and health.
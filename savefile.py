@@ -0,0 +1,457 @@
+"""
+Save File Module
+
+Defines the save record layout and reads/writes garden save files.
+
+The on-disk format is plain UTF-8 JSON. When the optional `orjson` package
+is installed it is used for encoding and decoding (several times faster than
+the standard library for large gardens); otherwise the built-in json module
+is used. With the optional `msgspec` package, saves can be encoded into a
+caller-owned buffer that is reused from one save to the next.
+
+Saves can be written zstd-compressed (level 3) as an explicit opt-in: set
+COMPRESS_SAVES to True, with the optional `zstandard` package installed.
+Compressed saves are format v1.2 and need zstandard to load. Builds before
+v1.2 cannot read them. By default, saves stay plain JSON. Compressed files
+are recognised by their magic bytes on load.
+"""
+
+import datetime
+import json
+import sys
+import threading
+import time
+from operator import attrgetter
+
+# orjson is optional; the standard library json module is the fallback
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+# msgspec is optional; enables encoding into a reused buffer (see dumps())
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+    _msgspec_encoder = msgspec.json.Encoder()
+except ImportError:
+    msgspec = None
+    MSGSPEC_AVAILABLE = False
+    _msgspec_encoder = None
+
+# zstandard is optional; saves are written uncompressed without it
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None
+    ZSTD_AVAILABLE = False
+
+# Opt-in: write zstd-compressed (v1.2) saves when zstandard is available.
+# Off by default so saves stay readable without zstandard and by older builds.
+COMPRESS_SAVES = False
+
+# Frame header that starts every zstd-compressed save
+ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+ZSTD_LEVEL = 3
+
+# (De)compressors are created on first use and then reused. zstandard
+# objects are not thread-safe and saves are read from both the Tk thread
+# (load menu) and the I/O thread, so each thread keeps its own.
+_zstd_local = threading.local()
+
+
+# ============================================================================
+# Format Versions
+# ============================================================================
+
+# Written to save_data['version']. Builds only load versions they know:
+#   v1.0  plant records carry their trait dict inline
+#   v1.1  plant traits are pooled in save_data['traits_pool'] (pool_traits())
+#   v1.2  v1.1 written zstd-compressed (COMPRESS_SAVES only)
+SAVE_VERSION_INLINE = 'v1.0'
+SAVE_VERSION_POOLED = 'v1.1'
+SAVE_VERSION_ZSTD = 'v1.2'
+SAVE_VERSION = SAVE_VERSION_POOLED
+SUPPORTED_VERSIONS = (SAVE_VERSION_INLINE, SAVE_VERSION_POOLED, SAVE_VERSION_ZSTD)
+
+
+def compression_enabled():
+    """True when saves should be written zstd-compressed (format v1.2)."""
+    return COMPRESS_SAVES and ZSTD_AVAILABLE
+
+
+# ============================================================================
+# Record Schemas
+# ============================================================================
+
+# Plant dataclass attributes copied into each per-plant save record
+PLANT_FIELDS = (
+    'id', 'generation', 'stage', 'alive', 'days_since_planting',
+    'health', 'water',
+    'traits', 'revealed_traits', 'reveal_order',
+    'entered_stage5_age', 'max_age_days', 'senescent', 'germination_delay',
+    'pending_cross', 'pollinated', 'emasculated', 'emasc_day', 'emasc_phase',
+    'selfing_frac_before_emasc',
+    'pods_total', 'pods_remaining', 'ovules_per_pod', 'ovules_left', 'aborted_ovules',
+    'ancestry', 'paternal_ancestry',
+    'last_anther_check_day', 'anthers_available_today', 'anthers_collected_day',
+    'is_weak', 'weak_blocks_flowering', 'late_season_stress',
+)
+
+# Attributes set on plants at runtime (not dataclass fields), with the
+# value saved when a plant never received them
+PLANT_EXTRAS = (
+    ('fully_harvested', False),
+    ('genotype', None),
+    # Parentage — set by plant_seed()
+    ('mother_id', None),
+    ('father_id', None),
+    ('selfed', False),
+    # Pod provenance — needed by TIE to group siblings by pod
+    ('source_pod_index', None),
+)
+
+# Seed / Pollen inventory records
+SEED_FIELDS = (
+    'name', 'id', 'source_id', 'donor_id', 'traits',
+    'generation', 'pod_index', 'genotype', 'ancestry',
+)
+POLLEN_FIELDS = (
+    'name', 'id', 'source_id', 'collected_day', 'expires_day',
+    'genotype', 'traits',
+)
+
+# Values for seed / pollen record fields that older saves may lack
+SEED_DEFAULTS = {'donor_id': None, 'generation': 0, 'pod_index': 0}
+POLLEN_DEFAULTS = {'source_id': 0, 'collected_day': 0, 'expires_day': 0}
+
+# One C-level multi-attribute fetch per record, returning values in schema order
+plant_values = attrgetter(*PLANT_FIELDS)
+seed_values = attrgetter(*SEED_FIELDS)
+pollen_values = attrgetter(*POLLEN_FIELDS)
+
+
+# ============================================================================
+# Encoding
+# ============================================================================
+
+def dumps(save_data, buf=None):
+    """
+    Encode save data as compact UTF-8 JSON.
+
+    When msgspec is installed and buf is given, the JSON is encoded straight
+    into buf (grown as needed, capacity kept for the next save) and buf
+    itself is returned. The caller must not reuse buf until the returned
+    data has been written.
+
+    Args:
+        save_data: Dict produced by GardenApp._serialize_garden_state()
+        buf: Optional bytearray to encode into
+
+    Returns:
+        Encoded bytes-like object, ready to be written to a file opened in
+        binary mode
+    """
+    if buf is not None and MSGSPEC_AVAILABLE:
+        try:
+            _msgspec_encoder.encode_into(save_data, buf)
+            return buf
+        except (msgspec.EncodeError, TypeError, OverflowError):
+            # Unsupported value; fall through to the other encoders
+            pass
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(save_data, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits; let the stdlib encoder handle it
+            pass
+    return json.dumps(
+        save_data, ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+# Last (whole second, formatted string) pair produced by format_timestamp()
+_ts_cache = (None, '')
+
+
+def timestamp_ns() -> int:
+    """Current wall-clock time in integer nanoseconds, as stored in saves."""
+    return time.time_ns()
+
+
+def format_timestamp(ns: int) -> str:
+    """
+    Format a nanosecond timestamp as a local ISO-8601 string (to the second).
+
+    Saves made within the same second reuse the previously formatted string.
+
+    Args:
+        ns: Timestamp from timestamp_ns()
+
+    Returns:
+        String such as '2024-05-01T14:03:27'
+    """
+    global _ts_cache
+    sec = ns // 1_000_000_000
+    if _ts_cache[0] != sec:
+        _ts_cache = (
+            sec,
+            datetime.datetime.fromtimestamp(sec).isoformat(timespec='seconds'),
+        )
+    return _ts_cache[1]
+
+
+def compress(payload):
+    """
+    Zstd-compress an encoded save.
+
+    Only call this for saves whose version is SAVE_VERSION_ZSTD, i.e. when
+    compression_enabled() was true as the save was built.
+
+    Args:
+        payload: Bytes-like object returned by dumps()
+
+    Returns:
+        Compressed bytes, or payload unchanged without zstandard
+    """
+    if not ZSTD_AVAILABLE:
+        return payload
+    compressor = getattr(_zstd_local, 'compressor', None)
+    if compressor is None:
+        compressor = _zstd_local.compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL)
+    return compressor.compress(payload)
+
+
+def pool_traits(record, pool, index):
+    """
+    Replace a plant record's trait dict with an index into a shared pool.
+
+    Most plants in a garden share one of a handful of trait combinations,
+    so each distinct dict is written once (in save_data['traits_pool']).
+    Records whose traits are not flat and hashable are left inline.
+    Saves using the pool must be written as SAVE_VERSION_POOLED.
+
+    Args:
+        record: Plant record being built (modified in place)
+        pool: List of distinct trait dicts, appended to as needed
+        index: Dict mapping frozenset(traits.items()) -> position in pool
+    """
+    traits = record['traits']
+    try:
+        key = frozenset(traits.items())
+    except (AttributeError, TypeError):
+        return
+    idx = index.get(key)
+    if idx is None:
+        idx = index[key] = len(pool)
+        pool.append(traits)
+    del record['traits']
+    record['traits_idx'] = idx
+
+
+# ============================================================================
+# Decoding
+# ============================================================================
+
+def decompress(data):
+    """
+    Undo compress() if data is a zstd frame; plain JSON passes through.
+
+    Args:
+        data: Raw file contents (bytes)
+
+    Returns:
+        Uncompressed JSON bytes
+
+    Raises:
+        ValueError: If data is compressed but zstandard is not installed
+    """
+    if data[:4] != ZSTD_MAGIC:
+        return data
+    if not ZSTD_AVAILABLE:
+        raise ValueError(
+            "Save file is zstd-compressed; install the 'zstandard' package to load it"
+        )
+    decompressor = getattr(_zstd_local, 'decompressor', None)
+    if decompressor is None:
+        decompressor = _zstd_local.decompressor = zstandard.ZstdDecompressor()
+    return decompressor.decompress(data)
+
+
+def check_version(save_data):
+    """
+    Reject saves written in a format this build cannot read.
+
+    Saves without a 'version' key predate versioning and are read as v1.0.
+
+    Args:
+        save_data: Decoded save data dict
+
+    Raises:
+        ValueError: If the save's version is not in SUPPORTED_VERSIONS
+    """
+    version = save_data.get('version', SAVE_VERSION_INLINE)
+    if version not in SUPPORTED_VERSIONS:
+        raise ValueError(
+            f"Save format {version} is not supported by this version of the game"
+        )
+
+
+def loads(data):
+    """
+    Decode a save file's contents.
+
+    Args:
+        data: Raw file contents (bytes), plain or zstd-compressed
+
+    Returns:
+        Save data dict
+
+    Raises:
+        ValueError: If the save's format version is not supported
+    """
+    data = decompress(data)
+    if ORJSON_AVAILABLE:
+        save_data = orjson.loads(data)
+    else:
+        save_data = json.loads(data.decode("utf-8"))
+    check_version(save_data)
+    return save_data
+
+
+def load(filepath):
+    """
+    Read and decode a save file.
+
+    Args:
+        filepath: Path to the save file
+
+    Returns:
+        Save data dict
+    """
+    with open(filepath, 'rb') as f:
+        return loads(f.read())
+
+
+# ============================================================================
+# Interning
+# ============================================================================
+
+def intern_str(value):
+    """Intern value if it is a string; other values pass through unchanged."""
+    return sys.intern(value) if type(value) is str else value
+
+
+def intern_traits(traits):
+    """
+    Intern the keys and string values of a decoded trait dict.
+
+    Every plant, seed and pollen packet repeats the same handful of trait
+    names and values ("flower_color", "purple", ...); interning makes the
+    restored objects share one copy of each string.
+
+    Args:
+        traits: Trait dict as decoded from the save (may be empty or None)
+
+    Returns:
+        New dict with interned strings, or the input if it is empty/not a dict
+    """
+    if not traits or type(traits) is not dict:
+        return traits
+    return {sys.intern(k): intern_str(v) for k, v in traits.items()}
+
+
+# ============================================================================
+# Record Restore
+# ============================================================================
+# Turn decoded records into constructor-ready attribute dicts using the
+# schema tables above, so the loader needs no per-field .get() calls.
+
+def plant_state(record, traits_pool=()):
+    """
+    Build the attribute dict for Plant._from_state() from a plant record.
+
+    Args:
+        record: Decoded plant record (includes 'tile_idx')
+        traits_pool: Interned trait dicts from the save's 'traits_pool',
+            for records written with 'traits_idx' (see pool_traits())
+
+    Returns:
+        New dict of plant attributes; pooled traits are shared between
+        plants and must be treated as read-only
+    """
+    state = dict(record)
+    del state['tile_idx']
+    state['generation'] = intern_str(state['generation'])
+    if 'traits_idx' in state:
+        state['traits'] = traits_pool[state.pop('traits_idx')]
+    else:
+        # Saves from before the pool keep traits inline
+        state['traits'] = intern_traits(state['traits'])
+    state['revealed_traits'] = intern_traits(state['revealed_traits'])
+    state['reveal_order'] = [intern_str(t) for t in state['reveal_order']]
+    state['emasc_phase'] = intern_str(state.get('emasc_phase'))
+    # Runtime-only attributes: fill in the defaults older saves lack
+    for key, default in PLANT_EXTRAS:
+        if key not in state:
+            state[key] = default
+    # genotype / source_pod_index are only set on plants that have them
+    if not state['genotype']:
+        del state['genotype']
+    spidx = state.pop('source_pod_index')
+    if spidx is not None:
+        state['source_pod_index'] = int(spidx)
+    return state
+
+
+def seed_state(record):
+    """
+    Build Seed keyword arguments from a seed record.
+
+    Args:
+        record: Decoded seed record
+
+    Returns:
+        Dict with exactly the SEED_FIELDS keys
+
+    Raises:
+        KeyError: If 'id' or 'source_id' is missing
+    """
+    state = {**SEED_DEFAULTS, **record}
+    get = state.get  # bound once; called per field below
+    if get('name') is None:
+        state['name'] = f"Seed_{state['id']}"
+    state['traits'] = intern_traits(get('traits') or {})
+    state['generation'] = intern_str(state['generation'])
+    # Containers are created per seed, and only when missing
+    if not get('genotype'):
+        state['genotype'] = {}
+    if not get('ancestry'):
+        state['ancestry'] = []
+    return {key: state[key] for key in SEED_FIELDS}
+
+
+def pollen_state(record):
+    """
+    Build the attribute dict for Pollen._from_state() from a pollen record.
+
+    Args:
+        record: Decoded pollen record
+
+    Returns:
+        Dict with exactly the POLLEN_FIELDS keys
+
+    Raises:
+        KeyError: If 'id' is missing
+    """
+    state = {**POLLEN_DEFAULTS, **record}
+    get = state.get
+    if get('name') is None:
+        state['name'] = f"Pollen_{state['id']}"
+    state['traits'] = intern_traits(get('traits') or {})
+    if not get('genotype'):
+        state['genotype'] = {}
+    return {key: state[key] for key in POLLEN_FIELDS}